@@ -1,21 +1,92 @@
-# # alpha_models/__init__.py
-# from .base_model import BaseStrategy
-# from importlib import import_module
-# import pkgutil
-#
-# # discover all strategy modules
-# _strategy_classes = {}
-# for finder, name, ispkg in pkgutil.iter_modules(__path__):
-#     if name == "base_strategy" or name.startswith("_"):
-#         continue
-#     module = import_module(f"alpha_models.{name}")
-#     # find any subclass of BaseStrategy in the module
-#     for obj in vars(module).values():
-#         if isinstance(obj, type) and issubclass(obj, BaseStrategy) and obj is not BaseStrategy:
-#             _strategy_classes[obj.__name__.lower()] = obj
-#
-# def get_strategy(name: str) -> BaseStrategy:
-#     cls = _strategy_classes.get(name.lower())
-#     if not cls:
-#         raise KeyError(f"Strategy '{name}' not found. Available: {list(_strategy_classes)}")
-#     return cls
+# alpha_models/__init__.py
+import ast
+import pkgutil
+import sys
+from importlib import import_module
+from pathlib import Path
+
+from .base_model import BaseAlphaModel
+
+# Maps a lowercase strategy name to the (module, class) pair that defines it.
+# Populated on first use by scanning module sources, so no strategy module is
+# imported until a caller actually asks for it.
+_STRATEGY_MODULE_NAMES = None
+# Resolved strategy classes, filled lazily by get_strategy().
+_strategy_classes = {}
+
+
+def _declared_names(tree: ast.Module) -> tuple:
+    """Returns the names a module lists in a literal `__all__`, if any."""
+    for node in tree.body:
+        if (
+            isinstance(node, ast.Assign)
+            and len(node.targets) == 1
+            and isinstance(node.targets[0], ast.Name)
+            and node.targets[0].id == "__all__"
+        ):
+            try:
+                return tuple(ast.literal_eval(node.value))
+            except ValueError:
+                return ()
+    return ()
+
+
+def _discover() -> dict:
+    """
+    Builds the strategy-name -> (module, class) index without importing any
+    of the strategy modules. Each strategy module declares its strategy
+    class(es) in `__all__`; modules without one are not registered.
+    """
+    global _STRATEGY_MODULE_NAMES
+    if _STRATEGY_MODULE_NAMES is not None:
+        return _STRATEGY_MODULE_NAMES
+
+    names = {}
+    for module_info in pkgutil.iter_modules(__path__):
+        if (
+            module_info.ispkg
+            or module_info.name == "base_model"
+            or module_info.name.startswith("_")
+        ):
+            continue
+        source_path = Path(module_info.module_finder.path) / f"{module_info.name}.py"
+        try:
+            tree = ast.parse(source_path.read_text())
+        except (OSError, SyntaxError):
+            continue
+
+        module_name = f"{__name__}.{module_info.name}"
+        for class_name in _declared_names(tree):
+            names[class_name.lower()] = (module_name, class_name)
+
+    _STRATEGY_MODULE_NAMES = names
+    return names
+
+
+def get_strategy(name: str) -> type:
+    """
+    Looks up a strategy class by name (case-insensitive), importing its
+    module on first use.
+
+    Args:
+        name: The class name of the strategy, e.g. 'MeanReversionStrategy'.
+
+    Returns:
+        The BaseAlphaModel subclass registered under that name.
+    """
+    key = name.lower()
+    cls = _strategy_classes.get(key)
+    if cls is not None:
+        return cls
+
+    entry = _discover().get(key)
+    if entry is None:
+        raise KeyError(f"Strategy '{name}' not found. Available: {sorted(_discover())}")
+
+    module_name, class_name = entry
+    module = sys.modules.get(module_name) or import_module(module_name)
+    cls = getattr(module, class_name)
+    if not (isinstance(cls, type) and issubclass(cls, BaseAlphaModel)):
+        raise TypeError(f"'{module_name}.{class_name}' is not a BaseAlphaModel.")
+    _strategy_classes[key] = cls
+    return cls
@@ -0,0 +1,56 @@
+"""
+Rolling-window statistics for the alpha models.
+
+Bottleneck is an optional dependency. When it is installed, the moving mean and
+standard deviation run in its compiled C loops; otherwise they fall back to
+pandas `rolling()`. Both paths require a full window of non-NaN values
+(pandas' default `min_periods`) and return NumPy arrays.
+"""
+
+import numpy as np
+import pandas as pd
+
+try:
+    import bottleneck as bn
+
+    BOTTLENECK_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only when bottleneck is absent
+    BOTTLENECK_AVAILABLE = False
+
+
+def _flat_windows(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Returns a mask of full windows whose values are all identical.
+
+    Bottleneck's running sums leave rounding residue after long stretches of
+    varying data, so a flat window's mean can differ from its constant value
+    by a few ULPs. Pandas returns such windows exactly; these are patched to
+    match so `price > mean` style comparisons do not flip on flat prices.
+    """
+    return bn.move_max(values, window) == bn.move_min(values, window)
+
+
+def move_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling mean over `window` observations, NaN until the window is full."""
+    values = np.asarray(values, dtype=np.float64)
+    if not BOTTLENECK_AVAILABLE:
+        return pd.Series(values).rolling(window).mean().to_numpy()
+
+    mean = bn.move_mean(values, window)
+    flat = _flat_windows(values, window)
+    mean[flat] = values[flat]
+    return mean
+
+
+def move_std(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling sample (ddof=1) standard deviation over `window` observations."""
+    values = np.asarray(values, dtype=np.float64)
+    if not BOTTLENECK_AVAILABLE:
+        return pd.Series(values).rolling(window).std().to_numpy()
+
+    if window < 2:
+        # A single observation has no sample standard deviation
+        return np.full(values.shape, np.nan)
+    std = bn.move_std(values, window, ddof=1)
+    std[_flat_windows(values, window)] = 0.0
+    return std
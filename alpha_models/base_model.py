@@ -1,7 +1,48 @@
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Hashable, Iterator
 
 import pandas as pd
 
+# The memo of the enclosing `shared_intermediates()` block, or None outside one
+_intermediates = ContextVar("intermediates", default=None)
+
+
+@contextmanager
+def shared_intermediates() -> Iterator[None]:
+    """
+    Lets the strategies run inside the block share intermediates they derive
+    from the same price frame, e.g. the trials of one parameter-sweep batch.
+
+    The memo lives only as long as the block, so the caller must not modify
+    the price frames handed to strategies within it. Outside such a block
+    every strategy recomputes its intermediates on each call.
+    """
+    token = _intermediates.set({})
+    try:
+        yield
+    finally:
+        _intermediates.reset(token)
+
+
+def cached_intermediate(
+    price_data: pd.DataFrame, key: Hashable, compute: Callable[[], object]
+):
+    """
+    Returns `compute()`, reusing the value stored under `key` for this price
+    frame if called inside `shared_intermediates()`. Shared values must be
+    treated as read-only.
+    """
+    memo = _intermediates.get()
+    if memo is None:
+        return compute()
+    # The memo holds the frame itself, so its id() cannot be reused
+    entry = memo.get((id(price_data), key))
+    if entry is None:
+        entry = memo[(id(price_data), key)] = (price_data, compute())
+    return entry[1]
+
 
 class BaseAlphaModel(ABC):
     """
@@ -1,7 +1,10 @@
+import numpy as np
 import pandas as pd
 
 from .base_model import BaseAlphaModel
 
+__all__ = ["BuyAndHoldStrategy"]
+
 
 class BuyAndHoldStrategy(BaseAlphaModel):
     """
@@ -19,7 +22,8 @@ class BuyAndHoldStrategy(BaseAlphaModel):
 
         Returns:
             A DataFrame with a 'signal' column containing '1' for all dates.
+            The column is a read-only, zero-copy view of a single constant.
         """
-        signals = pd.DataFrame(index=price_data.index)
-        signals["signal"] = 1  # Signal to be long (hold)
-        return signals
+        # Signal to be long (hold); broadcasting avoids materializing N ones
+        long_signal = np.broadcast_to(np.int8(1), (len(price_data),))
+        return pd.DataFrame({"signal": long_signal}, index=price_data.index, copy=False)
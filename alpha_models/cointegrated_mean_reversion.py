@@ -1,6 +1,11 @@
+import numpy as np
 import pandas as pd
+
+from ._kernels import _coint_signals_loop
 from .base_model import BaseAlphaModel
 
+__all__ = ["CointegratedMeanReversionStrategy"]
+
 
 class CointegratedMeanReversionStrategy(BaseAlphaModel):
     """
@@ -14,6 +19,39 @@ class CointegratedMeanReversionStrategy(BaseAlphaModel):
         self.window = window
         self.threshold = threshold
         self.tickers = list(self.weights.keys())
+        # Weight vector aligned with self.tickers, built once for the spread GEMV
+        self._weight_vector = np.array(
+            [self.weights[t] for t in self.tickers], dtype=np.float64
+        )
+        self._ticker_index = pd.Index(self.tickers)
+        # (columns, column positions, weights) resolved for the last price frame
+        self._resolved_columns = None
+
+    def _resolve_columns(self, columns: pd.Index) -> tuple:
+        """
+        Maps the weighted tickers onto column positions of a price frame.
+
+        The result is cached against the (immutable) columns Index object, so
+        repeated calls on the same price data skip the label lookups and only
+        do the integer gather and matrix-vector product.
+
+        Returns:
+            A tuple of (column positions, aligned weight vector) covering the
+            tickers present in `columns`.
+        """
+        cached = self._resolved_columns
+        if cached is not None and cached[0] is columns:
+            return cached[1], cached[2]
+
+        column_positions = columns.get_indexer(self._ticker_index)
+        present = column_positions >= 0
+        weights = self._weight_vector
+        if not present.all():
+            column_positions = column_positions[present]
+            weights = weights[present]
+
+        self._resolved_columns = (columns, column_positions, weights)
+        return column_positions, weights
 
     def generate_signals(self, price_data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -26,42 +64,14 @@ class CointegratedMeanReversionStrategy(BaseAlphaModel):
             A DataFrame with a single 'signal' column for the entire portfolio.
         """
         # Ensure we only use the assets we have weights for
-        valid_tickers = [t for t in self.tickers if t in price_data.columns]
-        portfolio_prices = price_data[valid_tickers]
-
-        # Calculate the weighted portfolio spread
-        spread = (portfolio_prices * pd.Series(self.weights)).sum(axis=1)
-
-        # Calculate the Z-score of the spread
-        mean = spread.rolling(window=self.window).mean()
-        std = spread.rolling(window=self.window).std()
-        z_score = (spread - mean) / std
-
-        # Generate signals
-        signals = pd.DataFrame(index=z_score.index)
-        signals["z_score"] = z_score
-        signals["signal"] = 0
-
-        # Long signal
-        signals.loc[signals["z_score"] < -self.threshold, "signal"] = 1
-        # Short signal
-        signals.loc[signals["z_score"] > self.threshold, "signal"] = -1
-
-        # Fill forward to hold positions, but handle exits
-        # This is a simplified exit logic; more complex logic could be used
-        signals["signal"] = signals["signal"].ffill().fillna(0)
-
-        # Exit when crossing back over the mean
-        is_long = (
-            (signals["signal"].shift(1) == 1)
-            & (signals["z_score"].shift(1) < 0)
-            & (signals["z_score"] >= 0)
-        )
-        is_short = (
-            (signals["signal"].shift(1) == -1)
-            & (signals["z_score"].shift(1) > 0)
-            & (signals["z_score"] <= 0)
-        )
-        signals.loc[is_long | is_short, "signal"] = 0
+        column_positions, weights = self._resolve_columns(price_data.columns)
+
+        # Weighted portfolio spread as a single matrix-vector product (BLAS gemv),
+        # avoiding the N x K weighted-price intermediate
+        prices = price_data.iloc[:, column_positions].to_numpy(dtype=np.float64)
+        spread = prices @ weights
+
+        # Z-score and entry/exit logic are fused into one compiled pass
+        signals = _coint_signals_loop(spread, self.window, self.threshold)
 
-        return signals[["signal"]]  # Return only the final signal column
+        return pd.DataFrame({"signal": signals}, index=price_data.index, copy=False)
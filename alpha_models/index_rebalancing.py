@@ -1,6 +1,21 @@
+import numpy as np
 import pandas as pd
 
-from .base_model import BaseAlphaModel
+from .base_model import BaseAlphaModel, cached_intermediate
+
+__all__ = ["IndexRebalancingStrategy"]
+
+
+def _rebalance_positions(index: pd.DatetimeIndex, frequency: str) -> np.ndarray:
+    """
+    Returns the (read-only) row positions of the last trading day of each
+    period in a non-empty index.
+    """
+    # A period ends wherever the period label changes between consecutive rows
+    periods = index.to_period(frequency).asi8
+    positions = np.append(np.flatnonzero(periods[:-1] != periods[1:]), len(periods) - 1)
+    positions.flags.writeable = False
+    return positions
 
 
 class IndexRebalancingStrategy(BaseAlphaModel):
@@ -35,17 +50,19 @@ class IndexRebalancingStrategy(BaseAlphaModel):
         Returns:
             A DataFrame with a 'signal' column (2 for rebalance, 0 for hold).
         """
-        signals = pd.DataFrame(index=price_data.index)
-        signals["signal"] = 0.0
-
-        # Create a series that is True on the last business day of the period,
-        # a common convention for rebalancing.
-        resampled_index = price_data.resample(self.rebalance_frequency).last().index
-
-        # Find the intersection of ideal rebalance dates and actual trading days
-        valid_rebalance_dates = price_data.index.intersection(resampled_index)
-
-        # Set signal to 2 (rebalance) on those dates
-        signals.loc[valid_rebalance_dates, "signal"] = 2.0
+        signal = np.zeros(len(price_data), dtype=np.int8)
+        if len(signal):
+            # Rebalance on the last trading day of each period, a common convention
+            # for periodic rebalancing. Trials sharing a frequency in a sweep batch
+            # share the positions.
+            last_positions = cached_intermediate(
+                price_data,
+                ("rebalance_positions", self.rebalance_frequency),
+                lambda: _rebalance_positions(
+                    price_data.index, self.rebalance_frequency
+                ),
+            )
+            # Set the signal to 2 (our special code for 'rebalance') on those dates.
+            signal[last_positions] = 2
 
-        return signals
+        return pd.DataFrame({"signal": signal}, index=price_data.index, copy=False)
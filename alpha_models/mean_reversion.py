@@ -1,7 +1,10 @@
 import numpy as np
 import pandas as pd
 
-from .base_model import BaseAlphaModel
+from ._kernels import _mean_rev_signals_loop, _rolling_zscore
+from .base_model import BaseAlphaModel, cached_intermediate
+
+__all__ = ["MeanReversionStrategy"]
 
 
 class MeanReversionStrategy(BaseAlphaModel):
@@ -40,34 +43,17 @@ class MeanReversionStrategy(BaseAlphaModel):
         Returns:
             A DataFrame with a 'signal' column (1 for buy, -1 for sell, 0 for hold).
         """
-        signals = pd.DataFrame(index=price_data.index)
-        signals["signal"] = 0.0
-
-        # Calculate the moving average and standard deviation
-        signals["moving_avg"] = price_data["Close"].rolling(window=self.window).mean()
-        signals["moving_std"] = price_data["Close"].rolling(window=self.window).std()
-
-        # Calculate the Z-score
-        signals["z_score"] = (price_data["Close"] - signals["moving_avg"]) / signals[
-            "moving_std"
-        ]
-
-        # --- Determine the desired state (position) ---
-        # We want to be LONG (position=1) when the price is oversold (Z-score is very low).
-        # We want to be FLAT (position=0) when the price is overbought or has reverted to the mean.
+        # We want to be LONG (position=1) when the price is oversold (Z-score is
+        # very low) and FLAT otherwise; the signal is the change in position.
         # This strategy does not take short positions.
-        signals["position"] = np.where(signals["z_score"] < -self.threshold, 1.0, 0.0)
-
-        # Exit the position if the Z-score crosses back above the mean (e.g., 0)
-        signals["position"] = np.where(signals["z_score"] > 0, 0.0, signals["position"])
-
-        # Forward-fill the position to hold it until an exit signal is generated
-        signals["position"] = signals["position"].ffill().fillna(0)
-
-        # --- Convert positions (states) to signals (actions) ---
-        # A signal is the change in position from the previous day.
-        # .diff() will be 1 for a buy, -1 for a sell, and 0 for no change.
-        final_signals = pd.DataFrame(index=price_data.index)
-        final_signals["signal"] = signals["position"].diff().fillna(0)
-
-        return final_signals
+        # Trials sharing a window in a sweep batch share the rolling Z-score
+        z_scores = cached_intermediate(
+            price_data,
+            ("zscore", self.window),
+            lambda: _rolling_zscore(
+                price_data["Close"].to_numpy(dtype=np.float64), self.window
+            ),
+        )
+        signals = _mean_rev_signals_loop(z_scores, self.threshold)
+
+        return pd.DataFrame({"signal": signals}, index=price_data.index, copy=False)
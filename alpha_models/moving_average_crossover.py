@@ -1,7 +1,44 @@
+import numpy as np
 import pandas as pd
 
+from ._kernels import _ma_cross_batch, _ma_cross_loop, _rolling_mean
 from .base_model import BaseAlphaModel
 
+__all__ = ["MovingAverageCrossoverStrategy"]
+
+
+def batch_sma_signals(
+    close: np.ndarray, shorts: np.ndarray, longs: np.ndarray
+) -> np.ndarray:
+    """
+    Computes the crossover signals for many (short, long) window pairs at once.
+
+    Each distinct window's moving average is computed a single time and
+    shared by every pair that uses it. Row i of the result is the 'signal'
+    column `MovingAverageCrossoverStrategy(shorts[i], longs[i])` generates.
+
+    Args:
+        close: The close prices.
+        shorts: The short window of each pair.
+        longs: The long window of each pair.
+
+    Returns:
+        An int8 array of shape (len(shorts), len(close)).
+    """
+    close = np.asarray(close, dtype=np.float64)
+    shorts = np.asarray(shorts, dtype=np.int64)
+    longs = np.asarray(longs, dtype=np.int64)
+    windows, rows = np.unique(np.concatenate((shorts, longs)), return_inverse=True)
+
+    means = np.empty((len(windows), len(close)))
+    for k, window in enumerate(windows):
+        means[k] = _rolling_mean(close, window)
+
+    n_pairs = len(shorts)
+    return _ma_cross_batch(
+        means, rows[:n_pairs].astype(np.int64), rows[n_pairs:].astype(np.int64), longs
+    )
+
 
 class MovingAverageCrossoverStrategy(BaseAlphaModel):
     """
@@ -31,6 +68,7 @@ class MovingAverageCrossoverStrategy(BaseAlphaModel):
 
         A "buy" signal (1) is generated when the short-term MA crosses above the long-term MA.
         A "sell" signal (-1) is generated when the short-term MA crosses below the long-term MA.
+        No position is taken until a full long window of history is available.
 
         Args:
             price_data: A DataFrame with a 'Close' price column.
@@ -38,33 +76,9 @@ class MovingAverageCrossoverStrategy(BaseAlphaModel):
         Returns:
             A DataFrame with a 'signal' column (1 for buy, -1 for sell, 0 for hold).
         """
-        signals = pd.DataFrame(index=price_data.index)
-        signals["signal"] = 0.0
-
-        # Calculate the short and long moving averages
-        signals["short_mavg"] = (
-            price_data["Close"]
-            .rolling(window=self.short_window, min_periods=1, center=False)
-            .mean()
-        )
-        signals["long_mavg"] = (
-            price_data["Close"]
-            .rolling(window=self.long_window, min_periods=1, center=False)
-            .mean()
-        )
-
-        # --- Determine the desired state (position) ---
-        # We want to be LONG (position=1) when the short MA is above the long MA.
-        # We want to be FLAT (position=0) otherwise.
-        # This creates a boolean series (True/False) which is then converted to float (1.0/0.0).
-        signals["position"] = (signals["short_mavg"] > signals["long_mavg"]).astype(
-            float
-        )
-
-        # --- Convert positions (states) to signals (actions) ---
-        # A signal is the change in position from the previous day.
-        # .diff() will be 1.0 for a buy, -1.0 for a sell, and 0.0 for no change.
-        final_signals = pd.DataFrame(index=price_data.index)
-        final_signals["signal"] = signals["position"].diff().fillna(0)
-
-        return final_signals
+        # We want to be LONG (position=1) when the short MA is above the long MA
+        # and FLAT otherwise; the signal is the change in position.
+        close = price_data["Close"].to_numpy(dtype=np.float64)
+        signals = _ma_cross_loop(close, self.short_window, self.long_window)
+
+        return pd.DataFrame({"signal": signals}, index=price_data.index, copy=False)
@@ -1,8 +1,11 @@
 import numpy as np
 import pandas as pd
 
+from ._kernels import _rolling_zscore
 from .base_model import BaseAlphaModel
 
+__all__ = ["PairsTradingStrategy"]
+
 
 class PairsTradingStrategy(BaseAlphaModel):
     """
@@ -52,35 +55,45 @@ class PairsTradingStrategy(BaseAlphaModel):
         asset1, asset2 = price_data.columns[0], price_data.columns[1]
 
         # --- 1. Calculate the Spread and its Z-score ---
-        spread = price_data[asset1] / price_data[asset2]
-        mean_spread = spread.rolling(window=self.window).mean()
-        std_spread = spread.rolling(window=self.window).std()
-        z_score = (spread - mean_spread) / std_spread
-
-        # --- 2. Determine the desired state (position) for each asset ---
-        # This DataFrame will hold the desired position for each asset in the pair.
-        positions = pd.DataFrame(index=price_data.index)
-        positions[asset1] = 0.0
-        positions[asset2] = 0.0
-
-        # Long the spread (Buy asset1, Sell asset2) when Z-score is low
-        positions[asset1] = np.where(z_score < -self.threshold, 1.0, positions[asset1])
-        positions[asset2] = np.where(z_score < -self.threshold, -1.0, positions[asset2])
-
-        # Short the spread (Sell asset1, Buy asset2) when Z-score is high
-        positions[asset1] = np.where(z_score > self.threshold, -1.0, positions[asset1])
-        positions[asset2] = np.where(z_score > self.threshold, 1.0, positions[asset2])
-
-        # Exit position when Z-score crosses the mean (e.g., |Z-score| < 0.5)
-        exit_condition = np.abs(z_score) < 0.5
-        positions[asset1] = np.where(exit_condition, 0.0, positions[asset1])
-        positions[asset2] = np.where(exit_condition, 0.0, positions[asset2])
-
-        # Forward-fill positions to hold until an exit signal
-        positions = positions.ffill().fillna(0)
-
-        # --- 3. Convert positions (states) to signals (actions) ---
-        # A signal is the change in position from the previous day.
-        final_signals = positions.diff().fillna(0)
-
-        return final_signals
+        # Rolling mean, std and Z-score come out of one compiled Welford pass
+        spread = (price_data[asset1] / price_data[asset2]).to_numpy(dtype=np.float64)
+        z_score = _rolling_zscore(spread, self.window)
+
+        # --- 2./3. Spread position state, converted to per-asset signals ---
+        # Longing the spread buys asset1 and sells asset2, so asset2's signal
+        # is always the mirror image of asset1's.
+        signal = self._spread_signals(z_score, self.threshold)
+        return pd.DataFrame(
+            {asset1: signal, asset2: -signal}, index=price_data.index, copy=False
+        )
+
+    @staticmethod
+    def _spread_signals(z_score: np.ndarray, threshold: float) -> np.ndarray:
+        """
+        Converts a spread Z-score into asset1's trading signals.
+
+        The spread position is +1 (long: buy asset1, sell asset2) when the
+        Z-score is below -threshold, -1 (short) when above +threshold and 0
+        once it reverts inside |Z| < 0.5. Between those bands (and where the
+        Z-score is undefined) the previous position is held. The signal is
+        the change in position from the previous bar.
+        """
+        n_rows = len(z_score)
+        enter_long = z_score < -threshold
+        enter_short = z_score > threshold
+        exit_position = np.abs(z_score) < 0.5
+        decided = enter_long | enter_short | exit_position
+
+        # Forward-fill the last decided state: each bar takes the state of the
+        # most recent bar that made a decision (bars before the first stay flat)
+        last_decided = np.where(decided, np.arange(n_rows), -1)
+        np.maximum.accumulate(last_decided, out=last_decided)
+        # The exit band takes precedence over entries (only possible if the
+        # threshold is below 0.5)
+        state = enter_long.astype(np.int8) - enter_short.astype(np.int8)
+        state[exit_position] = 0
+        position = np.where(last_decided >= 0, state[last_decided], 0).astype(np.int8)
+
+        signal = np.zeros(n_rows, dtype=np.int8)
+        signal[1:] = position[1:] - position[:-1]
+        return signal
@@ -1,7 +1,27 @@
+import logging
+
 import numpy as np
 import pandas as pd
 
-from .base_model import BaseAlphaModel
+from ._kernels import _push_response_fit, _push_response_walk_forward
+from .base_model import BaseAlphaModel, cached_intermediate
+
+__all__ = ["PushResponseStrategy"]
+
+logger = logging.getLogger(__name__)
+
+
+def _push_response(prices: np.ndarray, tau: int) -> tuple:
+    """
+    Returns the (push, response) series of a price array. push[k] is the
+    tau-period change ending at k and response[k] the tau-period change that
+    followed it.
+    """
+    push = np.full(len(prices), np.nan)
+    push[tau:] = prices[tau:] - prices[:-tau]
+    response = np.full(len(prices), np.nan)
+    response[:-tau] = push[tau:]
+    return push, response
 
 
 # from tqdm import trange  # Using tqdm for progress visualization in long backtests
@@ -22,6 +42,7 @@ class PushResponseStrategy(BaseAlphaModel):
         training_window: int,
         num_bins: int = 50,
         threshold: float = 0.0,
+        refit_every: int = 1,
     ):
         """
         Initializes the PushResponseStrategy.
@@ -31,59 +52,63 @@ class PushResponseStrategy(BaseAlphaModel):
             training_window (int): The size of the rolling window of data to use for fitting the model.
             num_bins (int): The number of bins to discretize push values.
             threshold (float): The minimum expected response to trigger a signal.
+            refit_every (int): How many bars each fitted model is used for before
+                refitting. In walk-forward terms training_window is the fit
+                window and refit_every the execution window; 1 refits every bar.
         """
         super().__init__()
         if tau < 1 or training_window < 1:
             raise ValueError("tau and training_window must be positive integers.")
         if num_bins < 2:
             raise ValueError("num_bins must be at least 2.")
+        if refit_every < 1:
+            raise ValueError("refit_every must be a positive integer.")
 
         self.tau = tau
         self.training_window = training_window
         self.num_bins = num_bins
         self.threshold = threshold
+        self.refit_every = refit_every
+        # Quantile levels of the bin edges, rounded as np.percentile rounds
+        # them so the compiled fit reproduces pandas' qcut edges exactly
+        self._quantiles = 100 * np.linspace(0.0, 1.0, num_bins + 1) / 100
         self.model = None  # Stores the trained model
 
-    def _fit(self, prices: pd.Series):
+    def _fit(self, push: np.ndarray, response: np.ndarray):
         """
         Internal method to train the push-response model on a window of historical data.
-        """
-        df = pd.DataFrame({"price": prices})
-        df["push"] = df["price"].diff(self.tau)
-        df["response"] = df["price"].diff(self.tau).shift(-self.tau)
-        df.dropna(inplace=True)
-
-        if df.empty or len(df) < self.num_bins:
-            self.model = None  # Not enough data to fit
-            return
 
-        # Use qcut for more robust binning based on quantiles
-        df["push_bin"], bin_edges = pd.qcut(
-            df["push"], q=self.num_bins, labels=False, retbins=True, duplicates="drop"
+        Args:
+            push: The tau-period price changes in the training window.
+            response: The tau-period change that followed each push (aligned
+                      with `push`); pairs with a NaN on either side are ignored.
+        """
+        bin_edges, expected_responses = _push_response_fit(
+            push, response, self._quantiles
         )
-
-        model_data = df.groupby("push_bin")["response"].mean()
+        if len(bin_edges) == 0:
+            self.model = None  # Not enough data, or every push is identical
+            return
 
         self.model = {
             "bin_edges": bin_edges,
-            "expected_responses": model_data,
+            "expected_responses": expected_responses,
         }
 
-    def _predict(self, recent_prices: pd.Series) -> int:
+    def _predict(self, latest_push: float) -> int:
         """
         Internal method to generate a signal based on the latest push.
         """
-        if self.model is None or len(recent_prices) < self.tau + 1:
+        if self.model is None:
             return 0
 
-        latest_push = recent_prices.iloc[-1] - recent_prices.iloc[-1 - self.tau]
         bin_index = np.digitize(latest_push, self.model["bin_edges"]) - 1
 
         # Handle cases where the push is outside the learned range
         if bin_index < 0 or bin_index >= len(self.model["expected_responses"]):
             return 0
 
-        expected_response = self.model["expected_responses"].iloc[bin_index]
+        expected_response = self.model["expected_responses"][bin_index]
 
         if expected_response > self.threshold:
             return 1
@@ -96,29 +121,53 @@ class PushResponseStrategy(BaseAlphaModel):
         """
         Generates signals using a walk-forward methodology.
 
-        This method iterates through the price data, periodically refitting the
-        model on a rolling window of past data and generating a signal for the next step.
+        This method iterates through the price data, refitting the model every
+        `refit_every` bars on a rolling window of past data and generating a
+        signal for the next step.
         """
-        prices = price_data["Close"]
-        signals = pd.Series(index=prices.index, dtype=float).fillna(0.0)
+        n_rows = len(price_data)
+        signals = np.zeros(n_rows, dtype=np.int8)
 
         # Start generating signals only after the first training window is available
         start_index = self.training_window + self.tau
-        if len(prices) < start_index:
-            return pd.DataFrame({"signal": signals})  # Not enough data
-
-        print("Generating signals with walk-forward Push-Response model...")
-        # Use trange for a progress bar in the console
-        for i in range(start_index, len(prices)):
-            # Define the training data for this step
-            training_series = prices.iloc[i - self.training_window : i]
+        if n_rows <= start_index:
+            # Not enough data
+            return pd.DataFrame({"signal": signals}, index=price_data.index, copy=False)
+
+        logger.debug("Generating signals with walk-forward Push-Response model...")
+
+        # Push and response series are the same for every training window
+        # (and, in a sweep batch, for every model with this tau), so compute
+        # them once
+        push, response = cached_intermediate(
+            price_data,
+            ("push_response", self.tau),
+            lambda: _push_response(
+                price_data["Close"].to_numpy(dtype=np.float64), self.tau
+            ),
+        )
 
-            # Fit the model on the training data
-            self._fit(training_series)
+        # The walk-forward runs in a compiled kernel, one refit block per
+        # thread: each block fits on prices[i - training_window : i] at its
+        # first bar i and predicts each of its bars from the previous push.
+        signals = _push_response_walk_forward(
+            push,
+            response,
+            self._quantiles,
+            start_index,
+            self.training_window,
+            self.tau,
+            float(self.threshold),
+            self.refit_every,
+        )
 
-            # Predict the signal for the current time 'i' using data up to 'i-1'
-            # The push is calculated from prices at i-1 and i-1-tau
-            prediction_series = prices.iloc[i - self.tau - 1 : i]
-            signals.iloc[i] = self._predict(prediction_series)
+        # Leave the most recent block's fit as the model state, as a bar-by-bar
+        # walk-forward would
+        blocks = (n_rows - 1 - start_index) // self.refit_every
+        last_refit = start_index + blocks * self.refit_every
+        first = last_refit - self.training_window + self.tau
+        self._fit(
+            push[first : last_refit - self.tau], response[first : last_refit - self.tau]
+        )
 
-        return pd.DataFrame({"signal": signals})
+        return pd.DataFrame({"signal": signals}, index=price_data.index, copy=False)
@@ -1,8 +1,11 @@
 import numpy as np
 import pandas as pd
 
+from ._rolling import move_mean
 from .base_model import BaseAlphaModel
 
+__all__ = ["TrendFollowingStrategy"]
+
 
 class TrendFollowingStrategy(BaseAlphaModel):
     """
@@ -35,23 +38,19 @@ class TrendFollowingStrategy(BaseAlphaModel):
         Returns:
             A DataFrame with a 'signal' column (1 for buy, -1 for sell, 0 for hold).
         """
-        signals = pd.DataFrame(index=price_data.index)
-        signals["signal"] = 0.0
-
         # Calculate the moving average
-        signals["moving_avg"] = price_data["Close"].rolling(window=self.window).mean()
+        close = price_data["Close"].to_numpy(dtype=np.float64)
+        moving_avg = move_mean(close, self.window)
 
         # --- Determine the desired state (position) ---
         # We want to be LONG (position=1) when the price is above the moving average.
         # We want to be FLAT (position=0) otherwise.
-        signals["position"] = np.where(
-            price_data["Close"] > signals["moving_avg"], 1.0, 0.0
-        )
+        position = (close > moving_avg).astype(np.int8)
 
         # --- Convert positions (states) to signals (actions) ---
-        # A signal is the change in position from the previous day.
-        # .diff() will be 1 for a buy, -1 for a sell, and 0 for no change.
-        final_signals = pd.DataFrame(index=price_data.index)
-        final_signals["signal"] = signals["position"].diff().fillna(0)
+        # A signal is the change in position from the previous day:
+        # 1 for a buy, -1 for a sell, and 0 for no change.
+        signal = np.zeros(len(position), dtype=np.int8)
+        signal[1:] = np.diff(position)
 
-        return final_signals
+        return pd.DataFrame({"signal": signal}, index=price_data.index, copy=False)
@@ -1,13 +1,132 @@
-from itertools import groupby
-from typing import Dict, Optional, Tuple
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
-import matplotlib.dates as mdates
-import matplotlib.gridspec as gridspec
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-import seaborn as sns
-from matplotlib.ticker import FuncFormatter
+
+from utils.jit import NUMBA_AVAILABLE, njit
+
+# The plotting libraries are imported inside the tearsheet methods, so that
+# metric-only callers (backtests, parameter sweeps) never pay their import time
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+# Annualizes the standard deviation of daily returns
+_SQRT_252 = np.sqrt(252)
+
+
+def _sample_std(values: np.ndarray) -> float:
+    """
+    Sample (ddof=1) standard deviation ignoring NaNs, like `Series.std()`.
+
+    The reduction accumulates in float64 even for float32 input.
+    """
+    values = values[~np.isnan(values)]
+    if len(values) < 2:
+        return np.nan
+    return float(values.std(ddof=1, dtype=np.float64))
+
+
+@njit("Tuple((float32[:], float64, int64))(float32[:])", cache=True)
+def _drawdown_stats(portfolio_value: np.ndarray) -> Tuple[np.ndarray, float, int]:
+    """
+    Calculates the drawdown array, max drawdown, and the duration (in bars) of
+    the longest drawdown of a portfolio value array.
+
+    The running peak, the drawdowns, their minimum and the underwater run
+    lengths are all tracked in one compiled pass. NaN values are skipped by
+    the running peak (like `Series.cummax()`), give a NaN drawdown and end
+    the current underwater run.
+    """
+    n_rows = portfolio_value.shape[0]
+    drawdown = np.empty(n_rows, dtype=np.float32)
+    peak = np.float32(np.nan)
+    max_drawdown = np.nan
+    run_length = 0
+    max_drawdown_duration = 0
+
+    for i in range(n_rows):
+        value = portfolio_value[i]
+        if value > peak or np.isnan(peak):
+            peak = value
+        drawdown[i] = (value - peak) / peak
+
+        if drawdown[i] < 0:
+            run_length += 1
+            if run_length > max_drawdown_duration:
+                max_drawdown_duration = run_length
+        else:
+            run_length = 0
+        if drawdown[i] < max_drawdown or np.isnan(max_drawdown):
+            max_drawdown = float(drawdown[i])
+
+    return drawdown, max_drawdown, max_drawdown_duration
+
+
+def _drawdown_stats_vectorized(
+    portfolio_value: np.ndarray,
+) -> Tuple[np.ndarray, float, int]:
+    """
+    `_drawdown_stats` as array operations, used when Numba is not installed:
+    the running peak is an `fmax` accumulation (which skips NaNs) and the
+    longest drawdown comes from the edges of the underwater runs.
+    """
+    peak = np.fmax.accumulate(portfolio_value)
+    drawdown = (portfolio_value - peak) / peak
+    max_drawdown = float(np.fmin.reduce(drawdown, initial=np.nan))
+
+    underwater = np.concatenate(([False], drawdown < 0, [False]))
+    edges = np.flatnonzero(underwater[1:] != underwater[:-1])
+    run_lengths = edges[1::2] - edges[::2]
+    max_drawdown_duration = int(run_lengths.max()) if len(run_lengths) else 0
+    return drawdown, max_drawdown, max_drawdown_duration
+
+
+if not NUMBA_AVAILABLE:  # pragma: no cover - exercised only when numba is absent
+    _drawdown_stats = _drawdown_stats_vectorized
+
+
+def _compute_stats(
+    portfolio_value: pd.Series,
+    returns: np.ndarray,
+    initial_capital: float,
+    max_drawdown: float,
+    max_drawdown_duration: int,
+) -> Dict[str, float]:
+    """
+    Calculates the summary statistics of one equity curve from its value
+    series and (float32) returns, given its drawdown statistics.
+
+    Shared by the strategy's metrics and the tearsheet's benchmark column.
+    """
+    # --- Core Metrics ---
+    final_value = portfolio_value.iloc[-1]
+    total_return = (final_value / initial_capital) - 1.0
+
+    # --- Time-Based Metrics ---
+    days = (portfolio_value.index[-1] - portfolio_value.index[0]).days
+    annualized_return = (1 + total_return) ** (365.0 / days) - 1 if days > 0 else 0.0
+
+    # --- Risk & Risk-Adjusted Return Metrics ---
+    returns = returns[~np.isnan(returns)]
+    annualized_volatility = _sample_std(returns) * _SQRT_252
+    sharpe_ratio = (
+        annualized_return / annualized_volatility if annualized_volatility != 0 else 0.0
+    )
+
+    downside_std = _sample_std(returns[returns < 0]) * _SQRT_252
+    sortino_ratio = annualized_return / downside_std if downside_std != 0 else 0.0
+
+    return {
+        "Final Value": final_value,
+        "Total Return": total_return,
+        "Annualized Return": annualized_return,
+        "Annualized Volatility": annualized_volatility,
+        "Sharpe Ratio": sharpe_ratio,
+        "Sortino Ratio": sortino_ratio,
+        "Max Drawdown": max_drawdown,
+        "Max Drawdown Duration (Days)": max_drawdown_duration,
+    }
 
 
 class PerformanceAnalyzer:
@@ -38,97 +157,97 @@ class PerformanceAnalyzer:
         self.initial_capital = initial_capital
         self.returns = self.portfolio["returns"]
         self.portfolio_value = self.portfolio["total"]
+        # Single-precision copies for the metric reductions: they halve the
+        # memory traffic, and float32 is far more precise than these ratios
+        # need. The Series above are kept for plotting.
+        self._returns_f32 = self.returns.to_numpy(dtype=np.float32)
+        self._value_f32 = self.portfolio_value.to_numpy(dtype=np.float32)
 
     def calculate_all_metrics(self) -> Dict[str, float]:
         """
         Calculates and returns a dictionary of all key performance metrics.
         This is the single source of truth for summary statistics.
+
+        The metrics are computed once per analyzer; each call returns a fresh
+        copy so callers may add their own keys.
         """
-        # --- Core Metrics ---
-        final_value = self.portfolio_value.iloc[-1]
-        total_return = (final_value / self.initial_capital) - 1.0
-        trades = self.portfolio.get("trades", pd.Series(0, index=self.portfolio.index))
-        trade_count = (trades != 0).sum()
-
-        # --- Time-Based Metrics ---
-        days = (self.portfolio_value.index[-1] - self.portfolio_value.index[0]).days
-        annualized_return = (
-            (1 + total_return) ** (365.0 / days) - 1 if days > 0 else 0.0
+        return dict(self._metrics)
+
+    @cached_property
+    def _metrics(self) -> Dict[str, float]:
+        """The summary statistics behind calculate_all_metrics()."""
+        _drawdown, max_drawdown, max_drawdown_duration = self._drawdown_arrays
+        metrics = _compute_stats(
+            self.portfolio_value,
+            self._returns_f32,
+            self.initial_capital,
+            max_drawdown,
+            max_drawdown_duration,
         )
-
-        # --- Risk & Risk-Adjusted Return Metrics ---
-        annualized_volatility = self.returns.std() * np.sqrt(252)
-        sharpe_ratio = (
-            annualized_return / annualized_volatility
-            if annualized_volatility != 0
-            else 0.0
+        trades = self.portfolio.get("trades")
+        metrics["Trade Count"] = (
+            np.count_nonzero(trades.to_numpy()) if trades is not None else 0
         )
+        return metrics
 
-        downside_returns = self.returns[self.returns < 0]
-        downside_std = downside_returns.std() * np.sqrt(252)
-        sortino_ratio = annualized_return / downside_std if downside_std != 0 else 0.0
-
-        _series, max_drawdown, max_drawdown_duration = self._calculate_drawdowns()
-
-        return {
-            "Final Value": final_value,
-            "Total Return": total_return,
-            "Annualized Return": annualized_return,
-            "Annualized Volatility": annualized_volatility,
-            "Sharpe Ratio": sharpe_ratio,
-            "Sortino Ratio": sortino_ratio,
-            "Max Drawdown": max_drawdown,
-            "Max Drawdown Duration (Days)": max_drawdown_duration,
-            "Trade Count": trade_count,
-        }
-
-    def _calculate_drawdowns(self) -> Tuple[pd.Series, float, int]:
+    @cached_property
+    def _drawdown_arrays(self) -> Tuple[np.ndarray, float, int]:
+        """The drawdown array, max drawdown and longest drawdown duration."""
+        return _drawdown_stats(self._value_f32)
+
+    @cached_property
+    def _drawdowns(self) -> Tuple[pd.Series, float, int]:
         """
         Calculates the drawdown series, max drawdown, and the duration of the longest drawdown.
-        """
-        cumulative_max = self.portfolio_value.cummax()
-        drawdown = (self.portfolio_value - cumulative_max) / cumulative_max
-        max_drawdown = drawdown.min() if not drawdown.empty else 0.0
-
-        duration_check = np.where(drawdown < 0, 1, 0)
-        max_drawdown_duration = 0
-        if np.any(duration_check):
-            max_drawdown_duration = max(
-                sum(1 for _ in g) for k, g in groupby(duration_check) if k == 1
-            )
 
+        Computed once per analyzer; the portfolio history is not modified after
+        construction, so no invalidation is needed.
+        """
+        drawdown, max_drawdown, max_drawdown_duration = self._drawdown_arrays
+        drawdown = pd.Series(drawdown, index=self.portfolio_value.index)
         return drawdown, max_drawdown, max_drawdown_duration
 
+    @cached_property
+    def _log_returns(self) -> np.ndarray:
+        """
+        The log returns, log1p(r), computed once and shared by every period
+        aggregation. NaN returns count as zero.
+        """
+        return np.nan_to_num(np.log1p(self.returns.to_numpy(dtype=np.float64)))
+
     def get_aggregated_returns(self, period: str) -> pd.Series:
         """
         Aggregates returns by week, month, or year.
         """
+        frequencies = {"weekly": "W", "monthly": "M", "yearly": "Y"}
+        if period not in frequencies:
+            raise ValueError("Period must be one of 'weekly', 'monthly', or 'yearly'")
 
-        def cumulate_returns(x):
-            return np.expm1(np.log1p(x).sum())
+        # Compound each period's returns as expm1(sum(log1p(r))), summing the
+        # log returns of all periods in one pass
+        periods = self.returns.index.to_period(frequencies[period])
+        _, first, group = np.unique(
+            periods.asi8, return_index=True, return_inverse=True
+        )
+        period_sums = np.bincount(
+            group, weights=self._log_returns, minlength=len(first)
+        )
 
-        if period == "weekly":
-            return self.returns.groupby(self.returns.index.to_period("W")).apply(
-                cumulate_returns
-            )
-        elif period == "monthly":
-            return self.returns.groupby(self.returns.index.to_period("M")).apply(
-                cumulate_returns
-            )
-        elif period == "yearly":
-            return self.returns.groupby(self.returns.index.to_period("Y")).apply(
-                cumulate_returns
-            )
-        else:
-            raise ValueError("Period must be one of 'weekly', 'monthly', or 'yearly'")
+        return pd.Series(
+            np.expm1(period_sums), index=periods[first], name=self.returns.name
+        )
 
     # --- TEARSHEET GENERATION ---
 
-    def generate_tearsheet(self, title: str = "Strategy Performance") -> plt.Figure:
+    def generate_tearsheet(self, title: str = "Strategy Performance") -> "Figure":
         """
         Generates a full performance tearsheet and returns it as a Matplotlib figure.
         The caller is responsible for displaying or saving the figure.
         """
+        import matplotlib.gridspec as gridspec
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         sns.set_style("whitegrid")
         fig = plt.figure(figsize=(16, 12))
         fig.suptitle(title, y=0.94, weight="bold", fontsize=14)
@@ -136,16 +255,31 @@ class PerformanceAnalyzer:
 
         # Prepare stats for both strategy and benchmark
         strat_stats = self.calculate_all_metrics()
-        strat_stats["drawdown_series"], _, _ = self._calculate_drawdowns()
+        strat_stats["drawdown_series"], _, _ = self._drawdowns
         strat_stats["cum_returns"] = (1 + self.returns).cumprod()
 
         bench_stats = None
         if self.benchmark is not None and not self.benchmark.empty:
-            # Use a separate analyzer instance for the benchmark
-            bench_analyzer = PerformanceAnalyzer(self.benchmark, self.initial_capital)
-            bench_stats = bench_analyzer.calculate_all_metrics()
-            bench_stats["drawdown_series"], _, _ = bench_analyzer._calculate_drawdowns()
-            bench_stats["cum_returns"] = (1 + bench_analyzer.returns).cumprod()
+            # The benchmark only needs the summary statistics, so compute them
+            # directly rather than through a second analyzer
+            bench_value = self.benchmark["total"]
+            bench_returns = self.benchmark.get("returns")
+            if bench_returns is None:
+                bench_returns = bench_value.pct_change().fillna(0)
+            drawdown, max_drawdown, max_drawdown_duration = _drawdown_stats(
+                bench_value.to_numpy(dtype=np.float32)
+            )
+            bench_stats = _compute_stats(
+                bench_value,
+                bench_returns.to_numpy(dtype=np.float32),
+                self.initial_capital,
+                max_drawdown,
+                max_drawdown_duration,
+            )
+            bench_stats["drawdown_series"] = pd.Series(
+                drawdown, index=bench_value.index
+            )
+            bench_stats["cum_returns"] = (1 + bench_returns).cumprod()
 
         # Create plots
         self._plot_equity(strat_stats, bench_stats, ax=plt.subplot(gs[:2, :]))
@@ -159,6 +293,8 @@ class PerformanceAnalyzer:
 
     def _plot_equity(self, strat_stats, bench_stats, ax):
         """Plots cumulative rolling returns for strategy and benchmark."""
+        import matplotlib.dates as mdates
+
         ax.set_title("Cumulative Returns", fontweight="bold")
         ax.plot(
             strat_stats["cum_returns"],
@@ -183,6 +319,9 @@ class PerformanceAnalyzer:
 
     def _plot_drawdown(self, strat_stats, ax):
         """Plots the underwater curve."""
+        import matplotlib.dates as mdates
+        from matplotlib.ticker import FuncFormatter
+
         ax.set_title("Drawdown (%)", fontweight="bold")
         underwater = -100 * strat_stats["drawdown_series"]
         ax.fill_between(underwater.index, underwater, color="red", alpha=0.3)
@@ -191,6 +330,8 @@ class PerformanceAnalyzer:
 
     def _plot_monthly_returns(self, ax):
         """Plots a heatmap of the monthly returns."""
+        import seaborn as sns
+
         monthly_ret = self.get_aggregated_returns("monthly").unstack()
         monthly_ret = np.round(monthly_ret, 3)
         monthly_ret.rename(
@@ -227,6 +368,8 @@ class PerformanceAnalyzer:
 
     def _plot_yearly_returns(self, ax):
         """Plots a barplot of returns by year."""
+        from matplotlib.ticker import FuncFormatter
+
         ax.set_title("Yearly Returns (%)", fontweight="bold")
         yly_ret = self.get_aggregated_returns("yearly") * 100.0
         yly_ret.plot(ax=ax, kind="bar")
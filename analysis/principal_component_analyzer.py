@@ -1,6 +1,5 @@
+import numpy as np
 import pandas as pd
-from sklearn.decomposition import PCA
-from sklearn.preprocessing import StandardScaler
 
 
 class PrincipalComponentAnalyzer:
@@ -16,12 +15,24 @@ class PrincipalComponentAnalyzer:
             returns_df: A DataFrame where each column is an asset and each row is a return.
             n_components: The number of principal components to compute. Defaults to all.
         """
+        # Imported here so that importing this module does not load sklearn
+        from sklearn.decomposition import PCA
+
         if returns_df.empty or returns_df.isna().all().all():
             raise ValueError("Input DataFrame for PCA cannot be empty or all NaNs.")
 
-        self.returns_df = returns_df.dropna()
-        self.scaler = StandardScaler()
-        self.pca = PCA(n_components=n_components)
+        self.returns_df = (
+            returns_df.dropna() if returns_df.isna().any().any() else returns_df
+        )
+        # Randomized SVD only computes the leading components, which is much
+        # faster when a few are requested from a wide return matrix
+        svd_solver = (
+            "randomized"
+            if n_components is not None
+            and n_components < min(self.returns_df.shape) / 2
+            else "auto"
+        )
+        self.pca = PCA(n_components=n_components, svd_solver=svd_solver, random_state=0)
         self.results = {}
 
     def run(self) -> dict:
@@ -31,8 +42,13 @@ class PrincipalComponentAnalyzer:
         Returns:
             A dictionary containing PCA results, including explained variance and components.
         """
-        scaled_data = self.scaler.fit_transform(self.returns_df)
-        self.pca.fit(scaled_data)
+        # Standardize each asset as StandardScaler would (population std, with
+        # constant columns left at zero rather than divided by zero)
+        data = self.returns_df.to_numpy(dtype=np.float64)
+        centered = data - data.mean(axis=0)
+        scale = data.std(axis=0)
+        scale[scale == 0.0] = 1.0
+        self.pca.fit(centered / scale)
 
         self.results = {
             "explained_variance_ratio": self.pca.explained_variance_ratio_,
@@ -44,4 +60,4 @@ class PrincipalComponentAnalyzer:
             ),
             "eigenvalues": self.pca.explained_variance_,
         }
-        return self.results
\ No newline at end of file
+        return self.results
@@ -1,9 +1,403 @@
+import hashlib
+import itertools
+import math
+from functools import lru_cache, partial
+
 import numpy as np
 import pandas as pd
 import statsmodels.api as sm
-from pykalman import KalmanFilter
-from statsmodels.tsa.stattools import adfuller, coint
-from statsmodels.tsa.vector_ar.vecm import coint_johansen
+from joblib import Parallel, delayed, effective_n_jobs
+from scipy import linalg
+from statsmodels.tsa.adfvalues import mackinnoncrit, mackinnonp
+from statsmodels.tsa.coint_tables import c_sjt
+from statsmodels.tsa.stattools import adfuller
+
+from utils.jit import njit, prange
+
+
+class _ArrayKey:
+    """
+    Wraps an array so it can be passed to an `lru_cache`d function: equality
+    and hashing use a 128-bit digest of its contents instead of identity.
+    """
+
+    __slots__ = ("values", "_key")
+
+    def __init__(self, values):
+        self.values = np.asarray(values, dtype=np.float64)
+        digest = hashlib.blake2b(self.values.tobytes(), digest_size=16).digest()
+        self._key = (self.values.shape, digest)
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, _ArrayKey) and self._key == other._key
+
+
+# The tests below are pure functions of their input values, and the dashboard
+# re-runs them with identical series on every refresh, so their statsmodels
+# results are memoized by content.
+@lru_cache(maxsize=512)
+def _cached_adfuller(values: _ArrayKey) -> tuple:
+    return adfuller(values.values)
+
+
+@lru_cache(maxsize=512)
+def _cached_engle_granger(
+    values1: _ArrayKey,
+    values2: _ArrayKey,
+    fast: bool = False,
+    ols_method: str = "moments",
+) -> tuple:
+    """
+    Runs the Engle-Granger test as statsmodels' `coint()` does (constant
+    trend, AIC lag selection), reproducing its statistic and p-value: the
+    cointegrating regression is fitted in closed form, its residuals go
+    through `adfuller(regression="n")`, and the critical values and p-value
+    come from `mackinnoncrit` / `mackinnonp`. Fitting the regression here
+    means its hedge ratio is returned too instead of being refitted.
+
+    With `fast`, the residual ADF regression uses a fixed Schwert-rule lag,
+    int(12 * (n / 100) ** 0.25), instead of fitting one regression per
+    candidate lag to pick the AIC-best one. `ols_method` selects how the
+    cointegrating regression is solved (see `_simple_ols`).
+
+    Returns:
+        (t_statistic, p_value, critical_values, hedge_ratio)
+    """
+    y, x = values1.values, values2.values
+    alpha, hedge_ratio, r_squared = _simple_ols(x, y, ols_method)
+    if r_squared < 1 - 100 * np.sqrt(np.finfo(np.float64).eps):
+        residuals = y - alpha - hedge_ratio * x
+        if fast:
+            lag_options = {"maxlag": int(12 * (len(y) / 100) ** 0.25), "autolag": None}
+        else:
+            lag_options = {"autolag": "aic"}
+        t_statistic = adfuller(
+            residuals, regression="n", result_object=False, **lag_options
+        )[0]
+    else:
+        # (Almost) perfectly colinear series, for which coint() gives -inf
+        t_statistic = -np.inf
+
+    # coint() looks the critical values up with nobs - 1, to match Stata
+    crit_values = mackinnoncrit(N=2, regression="c", nobs=len(y) - 1)
+    p_value = mackinnonp(t_statistic, regression="c", N=2)
+    return t_statistic, p_value, crit_values, hedge_ratio
+
+
+@lru_cache(maxsize=512)
+def _cached_johansen(values: _ArrayKey, det_order: int, k_ar_diff: int) -> tuple:
+    return _johansen(values.values, det_order, k_ar_diff)
+
+
+@lru_cache(maxsize=512)
+def _cached_ols_fit(asset: _ArrayKey, benchmark: _ArrayKey):
+    benchmark_with_const = sm.add_constant(
+        pd.Series(benchmark.values, name="benchmark")
+    )
+    return sm.OLS(pd.Series(asset.values, name="asset"), benchmark_with_const).fit()
+
+
+def _ols_summary(asset: _ArrayKey, benchmark: _ArrayKey) -> str:
+    """Formats statsmodels' text report of the asset-on-benchmark regression."""
+    return str(_cached_ols_fit(asset, benchmark).summary())
+
+
+def _simple_ols(x: np.ndarray, y: np.ndarray, method: str = "moments") -> tuple:
+    """
+    Fits y = alpha + beta * x by least squares in closed form.
+
+    With a single regressor the normal equations reduce to sample moments, so
+    this avoids statsmodels' model/result machinery when only the
+    coefficients are needed.
+
+    Args:
+        method: 'moments' solves the centered normal equations directly;
+                'cholesky' Cholesky-factors the 2x2 normal equations of
+                [1, x] and solves them with scipy.
+
+    Returns:
+        (alpha, beta, r_squared)
+    """
+    y_mean = y.mean()
+    y_centered = y - y_mean
+    if method == "moments":
+        x_mean = x.mean()
+        x_centered = x - x_mean
+        beta = (x_centered @ y_centered) / (x_centered @ x_centered)
+        alpha = y_mean - beta * x_mean
+        residuals = y_centered - beta * x_centered
+    elif method == "cholesky":
+        design = np.column_stack((np.ones_like(x), x))
+        alpha, beta = linalg.cho_solve(
+            linalg.cho_factor(design.T @ design), design.T @ y
+        )
+        residuals = y - alpha - beta * x
+    else:
+        raise ValueError(f"Unknown OLS method '{method}'.")
+    r_squared = 1.0 - (residuals @ residuals) / (y_centered @ y_centered)
+    return alpha, beta, r_squared
+
+
+def _first_occurrences(index: pd.Index) -> np.ndarray:
+    """Returns a mask that is True at the first occurrence of each index label."""
+    mask = np.zeros(len(index), dtype=bool)
+    mask[np.unique(index.values, return_index=True)[1]] = True
+    return mask
+
+
+def _sanitize(data):
+    """
+    Drops duplicated dates (keeping the first) and rows with missing values,
+    as `data[~data.index.duplicated(keep="first")].dropna()` would, but with
+    one combined mask and a single selection.
+
+    Args:
+        data: A Series or DataFrame indexed by date.
+
+    Returns:
+        The cleaned Series or DataFrame (`data` itself if nothing is dropped).
+    """
+    keep = ~pd.isna(data.to_numpy())
+    if keep.ndim == 2:
+        keep = keep.all(axis=1)
+    if not data.index.is_unique:
+        keep &= _first_occurrences(data.index)
+    return data if keep.all() else data[keep]
+
+
+def _align_two_series(series1: pd.Series, series2: pd.Series) -> tuple:
+    """
+    Aligns two series on their dates and drops dates where either is missing
+    (keeping the first of any duplicated date), as
+    `pd.concat([series1, series2], axis=1).dropna()` would.
+
+    Series that already share an index, the common case for prices from one
+    source, are masked directly as arrays without building a DataFrame.
+
+    Returns:
+        (values1, values2) as aligned float64 arrays.
+    """
+    if series1.index.equals(series2.index):
+        values1 = series1.to_numpy(dtype=np.float64)
+        values2 = series2.to_numpy(dtype=np.float64)
+        keep = ~(np.isnan(values1) | np.isnan(values2))
+        if not series1.index.is_unique:
+            keep &= _first_occurrences(series1.index)
+        return values1[keep], values2[keep]
+
+    data = _sanitize(pd.concat([series1, series2], axis=1, keys=[0, 1]))
+    return data[0].to_numpy(dtype=np.float64), data[1].to_numpy(dtype=np.float64)
+
+
+def _project_out(y: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Returns the residuals of regressing each column of `y` on `x`."""
+    if x.size == 0:
+        return y
+    coefficients = linalg.lstsq(x, y, lapack_driver="gelsy")[0]
+    return y - x @ coefficients
+
+
+def _johansen(values: np.ndarray, det_order: int, k_ar_diff: int) -> tuple:
+    """
+    Runs the Johansen trace test, as statsmodels' `coint_johansen` does.
+
+    The differences and lagged levels are filtered on the lagged differences
+    in one least-squares solve. The reduced-rank problem
+    det(lambda * S_kk - S_k0 S_00^-1 S_0k) = 0 is then solved as a single
+    symmetric-definite generalized eigenproblem, whose eigenvectors come out
+    normalized so that v' S_kk v = I, as in statsmodels.
+
+    Returns:
+        (trace_statistics, trace_critical_values, eigenvectors), with the
+        eigenvalues (and eigenvector columns) in descending order.
+    """
+    nobs, neqs = values.shape
+    if det_order > -1:
+        trend = np.vander(np.linspace(-1, 1, nobs), det_order + 1)
+        values = _project_out(values, trend)
+
+    dx = np.diff(values, axis=0)
+    n_rows = dx.shape[0] - k_ar_diff
+    regressors = [
+        dx[k_ar_diff - lag : k_ar_diff - lag + n_rows]
+        for lag in range(1, k_ar_diff + 1)
+    ]
+    if det_order > -1:
+        # statsmodels demeans every side before filtering, which is the same
+        # as adding a constant to the regressors
+        regressors.append(np.ones((n_rows, 1)))
+    regressors = np.hstack(regressors) if regressors else np.empty((n_rows, 0))
+    residuals = _project_out(
+        np.hstack([dx[k_ar_diff:], values[1 : 1 + n_rows]]), regressors
+    )
+    r0t, rkt = residuals[:, :neqs], residuals[:, neqs:]
+
+    s00 = r0t.T @ r0t / n_rows
+    sk0 = rkt.T @ r0t / n_rows
+    skk = rkt.T @ rkt / n_rows
+    eigenvalues, eigenvectors = linalg.eigh(sk0 @ linalg.solve(s00, sk0.T), skk)
+    eigenvalues = eigenvalues[::-1]
+    eigenvectors = eigenvectors[:, ::-1]
+    # Normalize the sign by the first non-zero element, usually [0, 0]
+    non_zero = eigenvectors.flat != 0
+    if np.any(non_zero):
+        eigenvectors = eigenvectors * np.sign(eigenvectors.flat[non_zero][0])
+
+    trace_statistics = -n_rows * np.cumsum(np.log(1 - eigenvalues)[::-1])[::-1]
+    trace_critical_values = np.array([c_sjt(neqs - i, det_order) for i in range(neqs)])
+    return trace_statistics, trace_critical_values, eigenvectors
+
+
+@njit(
+    [
+        "Tuple((float64[:], float64[:], float64[:]))"
+        "(float64[:], float64, float64, float64, float64)",
+        "Tuple((float32[:], float32[:], float32[:]))"
+        "(float32[:], float64, float64, float64, float64)",
+    ],
+    cache=True,
+)
+def _kalman_1d(y: np.ndarray, Q: float, R: float, x0: float, P0: float) -> tuple:
+    """
+    Runs a scalar random-walk Kalman filter and RTS smoother over `y`.
+
+    The state follows x[t] = x[t-1] + w (variance Q) and is observed as
+    y[t] = x[t] + v (variance R), starting from x0 with variance P0. With one
+    state and one observation every matrix inverse is a reciprocal, so both
+    passes are plain loops.
+
+    The arrays have the dtype of `y`; the scalar arithmetic is in float64.
+
+    Returns:
+        The smoothed state means, their variances, and the smoother gains
+        (the last gain is unused and left at zero).
+    """
+    n_rows = y.shape[0]
+    x_pred = np.empty_like(y)
+    P_pred = np.empty_like(y)
+    x_filt = np.empty_like(y)
+    P_filt = np.empty_like(y)
+
+    for t in range(n_rows):
+        if t == 0:
+            x_pred[t] = x0
+            P_pred[t] = P0
+        else:
+            x_pred[t] = x_filt[t - 1]
+            P_pred[t] = P_filt[t - 1] + Q
+        S = P_pred[t] + R
+        K = P_pred[t] / S if S != 0.0 else 0.0
+        x_filt[t] = x_pred[t] + K * (y[t] - x_pred[t])
+        P_filt[t] = P_pred[t] - K * P_pred[t]
+
+    x_smooth = np.empty_like(y)
+    P_smooth = np.empty_like(y)
+    C = np.zeros_like(y)
+    if n_rows == 0:
+        return x_smooth, P_smooth, C
+    x_smooth[-1] = x_filt[-1]
+    P_smooth[-1] = P_filt[-1]
+    for t in range(n_rows - 2, -1, -1):
+        C[t] = P_filt[t] / P_pred[t + 1] if P_pred[t + 1] != 0.0 else 0.0
+        x_smooth[t] = x_filt[t] + C[t] * (x_smooth[t + 1] - x_pred[t + 1])
+        P_smooth[t] = P_filt[t] + C[t] * (P_smooth[t + 1] - P_pred[t + 1]) * C[t]
+
+    return x_smooth, P_smooth, C
+
+
+@njit(
+    [
+        "float64[:](float64[:], float64, float64, float64, float64, int64)",
+        "float32[:](float32[:], float64, float64, float64, float64, int64)",
+    ],
+    cache=True,
+)
+def _kalman_em_smooth(
+    y: np.ndarray, Q: float, R: float, x0: float, P0: float, n_iter: int
+) -> np.ndarray:
+    """
+    Smooths `y` with `_kalman_1d` after `n_iter` EM iterations.
+
+    Each iteration re-estimates the transition and observation variances and
+    the initial state mean and variance from the smoothed moments, in the
+    same closed form (and order) as pykalman's default `em()`.
+    """
+    n_rows = y.shape[0]
+    for _ in range(n_iter):
+        x_smooth, P_smooth, C = _kalman_1d(y, Q, R, x0, P0)
+
+        R = 0.0
+        for t in range(n_rows):
+            err = y[t] - x_smooth[t]
+            R += err * err + P_smooth[t]
+        if n_rows > 0:
+            R = R / n_rows
+
+        # Cov(x[t+1], x[t]) is P_smooth[t+1] * C[t]
+        Q = 0.0
+        for t in range(n_rows - 1):
+            err = x_smooth[t + 1] - x_smooth[t]
+            pair = P_smooth[t + 1] * C[t]
+            Q += err * err + P_smooth[t] + P_smooth[t + 1] - 2.0 * pair
+        if n_rows > 1:
+            Q = Q / (n_rows - 1)
+
+        if n_rows > 0:
+            x0 = x_smooth[0]
+            P0 = P_smooth[0]
+
+    return _kalman_1d(y, Q, R, x0, P0)[0]
+
+
+@njit(
+    [
+        "float64[:](float64[:], int64[:], float64, float64, float64, float64, int64)",
+        "float32[:](float32[:], int64[:], float64, float64, float64, float64, int64)",
+    ],
+    cache=True,
+    parallel=True,
+)
+def _kalman_em_smooth_many(
+    values: np.ndarray,
+    offsets: np.ndarray,
+    Q: float,
+    R: float,
+    x0: float,
+    P0: float,
+    n_iter: int,
+) -> np.ndarray:
+    """
+    Runs `_kalman_em_smooth` on several series at once, one per thread.
+
+    The series are concatenated in `values`; series i spans
+    values[offsets[i]:offsets[i + 1]], so they may differ in length.
+    """
+    smoothed = np.empty_like(values)
+    for i in prange(offsets.shape[0] - 1):
+        start, end = offsets[i], offsets[i + 1]
+        smoothed[start:end] = _kalman_em_smooth(values[start:end], Q, R, x0, P0, n_iter)
+    return smoothed
+
+
+# (Q, R, x0, P0, n_iter): the starting transition and observation variances,
+# initial state mean and variance, and the number of EM iterations
+_KALMAN_INITIAL_PARAMS = (0.01, 1.0, 0.0, 1.0, 5)
+
+
+def _screen_pairs(price_df: pd.DataFrame, pairs: list, fast: bool) -> list:
+    """
+    Runs the Engle-Granger test on a batch of column pairs in one worker.
+
+    Kept at module level so it can be pickled and shipped to worker processes.
+    """
+    analyzer = StatisticalAnalyzer()
+    return [
+        analyzer.run_engle_granger_test(price_df[first], price_df[second], fast)
+        for first, second in pairs
+    ]
 
 
 class StatisticalAnalyzer:
@@ -21,12 +415,16 @@ class StatisticalAnalyzer:
         if price_series.empty:
             return {"error": "Input series is empty."}
 
-        # The ADF test is performed on returns, which are more likely to be stationary
-        returns = price_series.pct_change().dropna()
-        if len(returns) < 20:  # Need a minimum number of observations
+        # The ADF test is performed on (log) returns, which are more likely to
+        # be stationary. Returns next to a missing or non-positive price drop out.
+        prices = price_series.to_numpy(dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = np.diff(np.log(prices))
+        returns = returns[np.isfinite(returns)]
+        if returns.size < 20:  # Need a minimum number of observations
             return {"error": "Not enough data points to perform ADF test."}
 
-        adf_result = adfuller(returns)
+        adf_result = _cached_adfuller(_ArrayKey(returns))
 
         p_value = adf_result[1]
         is_stationary = p_value < 0.05
@@ -40,74 +438,82 @@ class StatisticalAnalyzer:
             "p-value": p_value,
             "Lags Used": adf_result[2],
             "Number of Observations": adf_result[3],
-            "Critical Values": adf_result[4],
+            "Critical Values": dict(adf_result[4]),
             "is_stationary": is_stationary,
             "interpretation": interpretation,
         }
 
     def run_ols_regression(
-        self, asset_returns: pd.Series, benchmark_returns: pd.Series
+        self,
+        asset_returns: pd.Series,
+        benchmark_returns: pd.Series,
+        include_summary: bool = False,
     ) -> dict:
         """
         Performs an Ordinary Least Squares (OLS) regression to find Alpha and Beta.
-        """
-        data = pd.concat([asset_returns, benchmark_returns], axis=1)
-
-        if not data.index.is_unique:
-            data = data[~data.index.duplicated(keep="first")]
 
-        # --- BEST PRACTICE: Avoid inplace=True ---
-        data = data.dropna()
-        data.columns = ["asset", "benchmark"]
-
-        if len(data) < 30:
+        Args:
+            asset_returns: The asset's returns (the dependent variable).
+            benchmark_returns: The benchmark's returns (the regressor).
+            include_summary: If True, 'summary' is a callable returning
+                             statsmodels' full text report. It is only
+                             fitted and formatted when called. If False,
+                             'summary' is None.
+        """
+        asset_values, benchmark_values = _align_two_series(
+            asset_returns, benchmark_returns
+        )
+        if len(asset_values) < 30:
             return {
                 "error": "Not enough overlapping data points to perform regression."
             }
 
-        benchmark_with_const = sm.add_constant(data["benchmark"])
-        model = sm.OLS(data["asset"], benchmark_with_const).fit()
+        asset = _ArrayKey(asset_values)
+        benchmark = _ArrayKey(benchmark_values)
+        alpha, beta, r_squared = _simple_ols(benchmark.values, asset.values)
+        alpha *= 252
 
-        alpha = model.params.get("const", 0) * 252
-        beta = model.params.get("benchmark", 0)
-        r_squared = model.rsquared
+        # The statsmodels fit is only needed for the textual report
+        summary = partial(_ols_summary, asset, benchmark) if include_summary else None
 
         return {
             "Alpha (Annualized)": alpha,
             "Beta": beta,
             "R-squared": r_squared,
-            "summary": str(model.summary()),
+            "summary": summary,
         }
 
-    def run_engle_granger_test(self, series1: pd.Series, series2: pd.Series) -> dict:
+    def run_engle_granger_test(
+        self,
+        series1: pd.Series,
+        series2: pd.Series,
+        fast: bool = False,
+        ols_method: str = "moments",
+    ) -> dict:
         """
         Performs the Engle-Granger two-step cointegration test.
-        """
-        data = pd.concat([series1, series2], axis=1, keys=[series1.name, series2.name])
-
-        if not data.index.is_unique:
-            data = data[~data.index.duplicated(keep="first")]
 
-        # --- BEST PRACTICE: Avoid inplace=True ---
-        data = data.dropna()
+        By default the lag length of the residual ADF regression is chosen by
+        AIC, which fits one regression per candidate lag. Setting `fast` uses
+        Schwert's rule of thumb, int(12 * (n / 100) ** 0.25), as a fixed lag
+        instead: a single regression per test, at a small loss of power, which
+        is usually the right trade-off when screening many pairs.
 
-        if len(data) < 30:
+        `ols_method` picks how the hedge ratio is estimated: 'moments' (the
+        default) uses the centered closed form, 'cholesky' solves the normal
+        equations through a Cholesky factorization.
+        """
+        values1, values2 = _align_two_series(series1, series2)
+        if len(values1) < 30:
             return {
                 "error": "Not enough overlapping data points for cointegration test after cleaning."
             }
 
-        cleaned_series1 = data[series1.name]
-        cleaned_series2 = data[series2.name]
-
-        coint_t_statistic, p_value, crit_values = coint(
-            cleaned_series1, cleaned_series2
+        coint_t_statistic, p_value, crit_values, hedge_ratio = _cached_engle_granger(
+            _ArrayKey(values1), _ArrayKey(values2), fast, ols_method
         )
         is_cointegrated = p_value < 0.05
 
-        series2_with_const = sm.add_constant(cleaned_series2)
-        model = sm.OLS(cleaned_series1, series2_with_const).fit()
-        hedge_ratio = model.params.get(series2.name, 0)
-
         return {
             "test_name": "Engle-Granger",
             "p_value": p_value,
@@ -122,6 +528,33 @@ class StatisticalAnalyzer:
             "interpretation": f"The series are {'likely cointegrated' if is_cointegrated else 'not cointegrated'} with a p-value of {p_value:.4f}.",
         }
 
+    def run_pair_screening(
+        self, price_df: pd.DataFrame, n_jobs: int = -1, fast: bool = False
+    ) -> dict:
+        """
+        Runs the Engle-Granger test on every pair of columns, in parallel.
+
+        The pair tests are independent and CPU-bound, so they are split into
+        one contiguous batch per worker process with joblib.
+
+        Args:
+            price_df: A DataFrame of prices with one column per ticker.
+            n_jobs: Number of worker processes; -1 uses all cores, 1 runs serially.
+            fast: Use a fixed Schwert-rule ADF lag instead of AIC selection
+                  (see `run_engle_granger_test`).
+
+        Returns:
+            A dictionary mapping each (first, second) column pair to its
+            Engle-Granger result, in `itertools.combinations` order.
+        """
+        pairs = list(itertools.combinations(price_df.columns, 2))
+        batch_size = max(1, math.ceil(len(pairs) / effective_n_jobs(n_jobs)))
+        batches = Parallel(n_jobs=n_jobs)(
+            delayed(_screen_pairs)(price_df, pairs[start : start + batch_size], fast)
+            for start in range(0, len(pairs), batch_size)
+        )
+        return dict(zip(pairs, (result for batch in batches for result in batch)))
+
     def run_johansen_test(
         self, data: pd.DataFrame, det_order: int = 0, k_ar_diff: int = 1
     ) -> dict:
@@ -135,29 +568,26 @@ class StatisticalAnalyzer:
         if data.empty or data.shape[1] < 2:
             return {"error": "Input data must have at least two columns."}
 
-        # Defensive check for duplicate indices
-        if not data.index.is_unique:
-            data = data[~data.index.duplicated(keep="first")]
-
-        # This creates a new, clean DataFrame and avoids any potential
-        # issues with modifying slices of data.
-        data = data.dropna()
+        # Drop duplicated dates and rows with missing values
+        data = _sanitize(data)
 
         if len(data) < 50:  # Check length after all cleaning
             return {"error": "Not enough data points for Johansen test after cleaning."}
 
         try:
             # 2. Run the Test on the fully sanitized DataFrame
-            result = coint_johansen(data, det_order, k_ar_diff)
+            trace, crit_values, eigenvectors = _cached_johansen(
+                _ArrayKey(data.to_numpy()), det_order, k_ar_diff
+            )
 
             # ... (rest of the function is unchanged) ...
             # 3. Format Trace Statistics into a readable DataFrame
             trace_stats = pd.DataFrame(
-                data=result.cvt,  # Critical values
+                data=crit_values.copy(),  # Critical values (the result is cached)
                 index=[f"r <= {i}" for i in range(data.shape[1])],
                 columns=["90% Crit Value", "95% Crit Value", "99% Crit Value"],
             )
-            trace_stats["Trace Statistic"] = result.lr1
+            trace_stats["Trace Statistic"] = trace
             # Reorder columns for better readability
             trace_stats = trace_stats[
                 [
@@ -172,7 +602,7 @@ class StatisticalAnalyzer:
             num_cointegrating_relations = 0
             for i in range(data.shape[1]):
                 # Compare trace statistic to the 95% critical value
-                if result.lr1[i] > result.cvt[i, 1]:
+                if trace[i] > crit_values[i, 1]:
                     num_cointegrating_relations = i + 1
                 else:
                     break  # Stop when the stat is no longer significant
@@ -183,13 +613,13 @@ class StatisticalAnalyzer:
             )
 
             # The first column of the eigenvector matrix corresponds to the most significant relationship
-            primary_cointegrating_vector = result.evec[:, 0]
+            primary_cointegrating_vector = eigenvectors[:, 0].copy()
 
             # 5. Structure the Output Dictionary
             return {
                 "test_name": "Johansen",
                 "trace_statistics": trace_stats,
-                "eigenvectors": result.evec,
+                "eigenvectors": eigenvectors.copy(),
                 "primary_cointegrating_vector": primary_cointegrating_vector,
                 "num_cointegrating_relations": num_cointegrating_relations,
                 "tickers": data.columns.tolist(),
@@ -205,35 +635,71 @@ class StatisticalAnalyzer:
                 "error": f"An unexpected error occurred during the Johansen test: {e}"
             }
 
-    def run_kalman_filter_smoother(self, series: pd.Series) -> pd.DataFrame:
+    def run_kalman_filter_smoother(
+        self, series: pd.Series, dtype: type = np.float64
+    ) -> pd.DataFrame:
         """
         Applies a Kalman filter to smooth a time series.
 
+        The series is modelled as a random walk observed with noise. The noise
+        variances and the initial state are first fitted with 5 EM iterations,
+        then the series is run through the filter and RTS smoother.
+
         Args:
             series: The time series to smooth.
+            dtype: The precision of the filter's state arrays. np.float32
+                   halves their memory, e.g. for very long series, at
+                   ~1e-7 relative precision.
 
         Returns:
             A DataFrame containing the original and smoothed series.
         """
-        if not series.index.is_unique:
-            series = series[~series.index.duplicated(keep="first")]
-        series = series.dropna()
+        series = _sanitize(series)
         if series.empty:
             return pd.DataFrame({"original": [], "smoothed": []})
 
-        kf = KalmanFilter(
-            initial_state_mean=0,
-            n_dim_obs=1,
-            transition_matrices=1,
-            observation_matrices=1,
-            transition_covariance=0.01,
-            observation_covariance=1,
+        smoothed = _kalman_em_smooth(
+            series.to_numpy(dtype=dtype), *_KALMAN_INITIAL_PARAMS
         )
-        # Use the EM algorithm to find the best parameters for the filter
-        kf = kf.em(series.values, n_iter=5)
-        (smoothed_state_means, _) = kf.smooth(series.values)
-
         return pd.DataFrame(
-            {"original": series, "smoothed": smoothed_state_means.flatten()},
+            {"original": series, "smoothed": smoothed.astype(np.float64)},
             index=series.index,
         )
+
+    def run_kalman_filter_smoother_many(
+        self, price_df: pd.DataFrame, dtype: type = np.float64
+    ) -> dict:
+        """
+        Applies `run_kalman_filter_smoother` to every column of a DataFrame.
+
+        The columns are smoothed in parallel in a single compiled call, each
+        over its own non-missing values.
+
+        Args:
+            price_df: A DataFrame with one time series per column.
+            dtype: The precision of the filter's state arrays, as in
+                   `run_kalman_filter_smoother`.
+
+        Returns:
+            A dictionary mapping each column name to its original and
+            smoothed series.
+        """
+        columns = [_sanitize(price_df[c]) for c in price_df.columns]
+        lengths = [len(series) for series in columns]
+        offsets = np.concatenate(([0], np.cumsum(lengths))).astype(np.int64)
+        values = np.concatenate(
+            [series.to_numpy(dtype=dtype) for series in columns]
+            or [np.empty(0, dtype=dtype)]
+        )
+        smoothed = _kalman_em_smooth_many(values, offsets, *_KALMAN_INITIAL_PARAMS)
+        smoothed = smoothed.astype(np.float64)
+
+        return {
+            name: pd.DataFrame(
+                {"original": series, "smoothed": smoothed[start:end]},
+                index=series.index,
+            )
+            for name, series, start, end in zip(
+                price_df.columns, columns, offsets[:-1], offsets[1:]
+            )
+        }
@@ -1,11 +1,22 @@
+from dataclasses import fields
+from typing import Dict, List, Tuple
+
 import numpy as np
 import pandas as pd
 
 from alpha_models.base_model import BaseAlphaModel
 from analysis.performance_analyzer import PerformanceAnalyzer
-from backtesting.events import OrderEvent
+from backtesting.events import Direction, FillEvent, OrderEvent
 from execution.simulated_handler import SimulatedExecutionHandler
 
+# The trade log is kept as one list per FillEvent field (struct of arrays)
+# rather than a list of fills, so building its DataFrame is a column copy
+_TRADE_FIELDS = tuple(field.name for field in fields(FillEvent) if field.init)
+
+
+def _empty_trades() -> Dict[str, List]:
+    return {name: [] for name in _TRADE_FIELDS}
+
 
 class Backtester:
     """
@@ -26,7 +37,7 @@ class Backtester:
         self.initial_capital = initial_capital
         self.transaction_cost = transaction_cost
         self.results = None
-        self.trade_log = []
+        self._trades = _empty_trades()
         self.execution_handler = execution_handler or SimulatedExecutionHandler()
 
     def run(self, price_data: pd.DataFrame, model: BaseAlphaModel) -> pd.DataFrame:
@@ -36,76 +47,173 @@ class Backtester:
         """
         # 1. Generate signals from the model
         signals = model.generate_signals(price_data=price_data)
-        self.trade_log = []
 
-        # 2. Prepare the portfolio DataFrame for state tracking
-        portfolio = price_data[["Close"]].copy()
-        portfolio["signal"] = signals["signal"].ffill().fillna(0)
-        portfolio["holdings"] = 0.0
-        portfolio["cash"] = self.initial_capital
-        portfolio["position"] = 0.0  # Number of shares held
+        # 2. Align the signals to the price bars
+        signal = signals["signal"]
+        if not signal.index.equals(price_data.index):
+            signal = signal.reindex(price_data.index)
+        signal = signal.ffill().fillna(0)
+
+        portfolio, self._trades = self._simulate(price_data, signal.to_numpy())
+        self.results = portfolio
+        return portfolio
+
+    def run_batch(
+        self, price_data: pd.DataFrame, signals: np.ndarray
+    ) -> List[pd.DataFrame]:
+        """
+        Runs one backtest per row of a precomputed signal matrix, e.g. the
+        output of `batch_sma_signals` for a parameter grid.
+
+        Args:
+            price_data: A DataFrame with a 'Close' price column.
+            signals: A (num_runs, len(price_data)) array of signals, already
+                     aligned to the price bars.
 
-        # 3. Use a stateful loop to process trades realistically
-        position = 0.0
+        Returns:
+            The portfolio history of each run, in row order. `results` and
+            `trade_log` are left holding those of the last run.
+        """
+        portfolios = []
+        for signal_values in signals:
+            portfolio, self._trades = self._simulate(price_data, signal_values)
+            portfolios.append(portfolio)
+        self.results = portfolios[-1] if portfolios else None
+        return portfolios
+
+    def _simulate(
+        self, price_data: pd.DataFrame, signal_values: np.ndarray
+    ) -> Tuple[pd.DataFrame, Dict[str, List]]:
+        """
+        Trades one aligned signal array against the price bars.
+
+        Returns:
+            The portfolio history and the fills, as one list per FillEvent
+            field.
+        """
+        trades = _empty_trades()
+        close = price_data["Close"].to_numpy()
+        index = price_data.index
+
+        # 3. Process trades realistically. A flat book can only trade on a
+        # buy bar (signal 1) and a long one only on a liquidation bar (signal
+        # 0), so the loop jumps straight to the next candidate bar instead of
+        # visiting every bar.
+        buy_bars = np.flatnonzero(signal_values == 1)
+        sell_bars = np.flatnonzero(signal_values == 0)
+        position = 0  # Whole shares
         cash = self.initial_capital
         symbol = price_data.name if hasattr(price_data, "name") else "Asset"
 
-        for i in range(len(portfolio)):
-            date = portfolio.index[i]
-            price = portfolio["Close"].iloc[i]
-            signal = portfolio["signal"].iloc[i]
+        # Bars at which the position/cash change, and their new values
+        change_bars, positions, cashes = [], [], []
+        bar = 0
+        while True:
+            candidates = buy_bars if position == 0 else sell_bars
+            k = np.searchsorted(candidates, bar)
+            if k == len(candidates):
+                break
+            bar = candidates[k]
+            date = index[bar]
+            price = close[bar]
+            traded = False
 
             # --- REFACTOR: Trading logic now uses the event-driven system ---
-            if signal == 1 and np.isclose(position, 0):  # Buy signal
+            if position == 0:  # Buy signal
                 if price > 0:
                     # Determine max shares possible based on current cash
                     shares_to_buy = np.floor(cash / price)
                     if shares_to_buy > 0:
-                        order = OrderEvent(date, symbol, "MKT", shares_to_buy, "BUY")
+                        order = OrderEvent(
+                            date, symbol, "MKT", int(shares_to_buy), Direction.BUY
+                        )
                         fill = self.execution_handler.execute_order(order, price)
 
                         # Ensure we can afford the filled order
                         if cash >= fill.total_cost:
-                            position += fill.quantity
+                            position += int(fill.quantity)
                             cash -= fill.total_cost
-                            self.trade_log.append(fill)
+                            self._record_fill(trades, fill)
+                            traded = True
 
-            elif signal == 0 and position > 0:  # Sell signal (liquidate position)
-                order = OrderEvent(date, symbol, "MKT", position, "SELL")
+            else:  # Sell signal (liquidate position)
+                order = OrderEvent(date, symbol, "MKT", position, Direction.SELL)
                 fill = self.execution_handler.execute_order(order, price)
 
-                position -= fill.quantity  # Should go to zero
+                position -= int(fill.quantity)  # Should go to zero
                 cash += fill.total_cost
-                self.trade_log.append(fill)
-
-            # --- Update Portfolio State for the current day ---
-            portfolio.iloc[i, portfolio.columns.get_loc("position")] = position
-            portfolio.iloc[i, portfolio.columns.get_loc("cash")] = cash
-            portfolio.iloc[i, portfolio.columns.get_loc("holdings")] = position * price
-
-        # 4. Calculate final portfolio values
-        portfolio["total"] = portfolio["holdings"] + portfolio["cash"]
+                self._record_fill(trades, fill)
+                traded = True
+
+            if traded:
+                change_bars.append(bar)
+                positions.append(position)
+                cashes.append(cash)
+            bar += 1
+
+        # 4. Expand the state changes to one row per bar: each bar carries the
+        # state set at the most recent change at or before it
+        segment = np.searchsorted(change_bars, np.arange(len(close)), side="right")
+        position_values = np.r_[0.0, positions][segment]
+        cash_values = np.r_[self.initial_capital, cashes][segment]
+        holdings = position_values * close
+
+        # 5. Build the portfolio history once
+        total = holdings + cash_values
+        portfolio = pd.DataFrame(
+            {
+                "Close": close,
+                "signal": signal_values,
+                "holdings": holdings,
+                "cash": cash_values,
+                "position": position_values,
+                "total": total,
+            },
+            index=index,
+        )
         portfolio["returns"] = portfolio["total"].pct_change().fillna(0)
-
-        self.results = portfolio
-        return portfolio
+        return portfolio, trades
+
+    @staticmethod
+    def _record_fill(trades: Dict[str, List], fill: FillEvent) -> None:
+        """Appends a fill's fields to the trade columns."""
+        trades["timestamp"].append(fill.timestamp)
+        trades["symbol"].append(fill.symbol)
+        trades["direction"].append(fill.direction)
+        trades["quantity"].append(fill.quantity)
+        trades["fill_price"].append(fill.fill_price)
+        trades["commission"].append(fill.commission)
+
+    @property
+    def trade_log(self) -> List[FillEvent]:
+        """The fills of the last backtest, rebuilt as FillEvent objects."""
+        return [
+            FillEvent(*row)
+            for row in zip(*(self._trades[name] for name in _TRADE_FIELDS))
+        ]
 
     def get_trade_log(self) -> pd.DataFrame:
         """
         Returns the log of all trades executed during the backtest as a DataFrame.
         """
-        if not self.trade_log:
+        if not self._trades["timestamp"]:
             return pd.DataFrame()
-        return pd.DataFrame([vars(fill) for fill in self.trade_log])
+        return pd.DataFrame(self._trades, columns=list(_TRADE_FIELDS))
 
-    def get_performance_metrics(self) -> dict:
+    def get_performance_metrics(self, portfolio: pd.DataFrame = None) -> dict:
         """
         Calculates performance metrics by delegating to the PerformanceAnalyzer.
+
+        Args:
+            portfolio: The portfolio history to evaluate, e.g. one returned by
+                       `run_batch`. Defaults to the last run's results.
         """
-        if self.results is None or self.results.empty:
+        if portfolio is None:
+            portfolio = self.results
+        if portfolio is None or portfolio.empty:
             return {}  # Return empty dict if no results exist
 
-        analyzer = PerformanceAnalyzer(self.results, self.initial_capital)
+        analyzer = PerformanceAnalyzer(portfolio, initial_capital=self.initial_capital)
         return analyzer.calculate_all_metrics()
 
     def run_and_get_metrics(
@@ -1,22 +1,34 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from enum import IntEnum
 
 
-@dataclass
+class Direction(IntEnum):
+    """
+    The side of an order or fill, signed so that `direction * quantity` is
+    the change in position.
+    """
+
+    BUY = 1
+    SELL = -1
+
+
+@dataclass(slots=True, frozen=True)
 class OrderEvent:
     """
     Represents the intention to place an order on the market.
     The backtester generates these, and the execution handler acts on them.
+    Orders are immutable; use `dataclasses.replace` to derive a modified one.
     """
 
     timestamp: datetime
     symbol: str
     order_type: str  # e.g., 'MKT' for Market Order
     quantity: float
-    direction: str  # 'BUY' or 'SELL'
+    direction: Direction
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FillEvent:
     """
     Represents a filled order, as returned by an execution handler.
@@ -25,15 +37,15 @@ class FillEvent:
 
     timestamp: datetime
     symbol: str
-    direction: str
+    direction: Direction
     quantity: float
     fill_price: float
     commission: float
+    # The total cost of the transaction, including commission. Fills are
+    # immutable, so it is computed once on creation.
+    total_cost: float = field(init=False, repr=False, compare=False)
 
-    @property
-    def total_cost(self) -> float:
-        """The total cost of the transaction, including commission."""
-        if self.direction == "BUY":
-            return (self.quantity * self.fill_price) + self.commission
-        else:  # SELL
-            return (self.quantity * self.fill_price) - self.commission
+    def __post_init__(self):
+        # Commission adds to what a buy pays and comes off what a sell receives
+        total_cost = self.quantity * self.fill_price + self.direction * self.commission
+        object.__setattr__(self, "total_cost", total_cost)
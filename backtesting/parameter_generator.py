@@ -35,42 +35,94 @@ class BaseParameterGenerator(ABC):
         """
         raise NotImplementedError("Subclasses must implement generate_combinations().")
 
+    @staticmethod
+    def _combinations_from_grid(
+        grid: Dict[str, np.ndarray],
+    ) -> Iterator[Tuple[Dict, Dict]]:
+        """Yields one (model_params, display_params) pair per row of a grid."""
+        names = list(grid)
+        for values in zip(*(grid[name].tolist() for name in names)):
+            model_params = dict(zip(names, values))
+            display_params = model_params.copy()
+            yield model_params, display_params
+
 
 class MACrossoverParameterGenerator(BaseParameterGenerator):
     """Generates parameter combinations for the Moving Average Crossover strategy."""
 
-    def generate_combinations(self) -> Iterator[Tuple[Dict, Dict]]:
+    def generate_grid(self) -> Dict[str, np.ndarray]:
+        """
+        Builds every valid (short, long) window pair as two aligned arrays.
+
+        Pairs whose short window is not shorter than the long one are dropped.
+        Pairs are ordered by short window, then long window.
+
+        Returns:
+            Dict[str, np.ndarray]: {'short_window': ..., 'long_window': ...}.
+        """
         s_range = self.params.get("mac_short_range", [10, 20])
         s_step = self.params.get("mac_short_step", 2)
         l_range = self.params.get("mac_long_range", [30, 50])
         l_step = self.params.get("mac_long_step", 5)
 
-        shorts = range(s_range[0], s_range[1] + 1, s_step)
-        longs = range(l_range[0], l_range[1] + 1, l_step)
+        shorts = np.arange(s_range[0], s_range[1] + 1, s_step)
+        longs = np.arange(l_range[0], l_range[1] + 1, l_step)
+        short_grid, long_grid = np.meshgrid(shorts, longs, indexing="ij")
+        valid = short_grid < long_grid
+        return {"short_window": short_grid[valid], "long_window": long_grid[valid]}
 
-        for s, l in itertools.product(shorts, longs):
-            if s >= l:
-                continue
-            model_params = {"short_window": s, "long_window": l}
-            display_params = model_params.copy()
-            yield model_params, display_params
+    def generate_combinations(self) -> Iterator[Tuple[Dict, Dict]]:
+        return self._combinations_from_grid(self.generate_grid())
 
 
 class MeanReversionParameterGenerator(BaseParameterGenerator):
     """Generates parameter combinations for the Mean Reversion strategy."""
 
-    def generate_combinations(self) -> Iterator[Tuple[Dict, Dict]]:
+    def generate_grid(self) -> Dict[str, np.ndarray]:
+        """
+        Builds every (window, threshold) pair as two aligned arrays, ordered
+        by window, then threshold.
+
+        Returns:
+            Dict[str, np.ndarray]: {'window': ..., 'threshold': ...}.
+        """
         w_range = self.params.get("mr_window_range", [15, 30])
         w_step = self.params.get("mr_window_step", 5)
         t_range = self.params.get("mr_threshold_range", [1.0, 2.0])
         t_step = self.params.get("mr_threshold_step", 0.5)
 
-        windows = range(w_range[0], w_range[1] + 1, w_step)
-        thresholds = [
-            round(t, 2) for t in np.arange(t_range[0], t_range[1] + t_step, t_step)
-        ]
+        windows = np.arange(w_range[0], w_range[1] + 1, w_step)
+        thresholds = np.array(
+            [round(t, 2) for t in np.arange(t_range[0], t_range[1] + t_step, t_step)]
+        )
+        window_grid, threshold_grid = np.meshgrid(windows, thresholds, indexing="ij")
+        return {"window": window_grid.ravel(), "threshold": threshold_grid.ravel()}
 
-        for w, t in itertools.product(windows, thresholds):
-            model_params = {"window": w, "threshold": t}
+    def generate_combinations(self) -> Iterator[Tuple[Dict, Dict]]:
+        return self._combinations_from_grid(self.generate_grid())
+
+
+class PushResponseParameterGenerator(BaseParameterGenerator):
+    """Generates parameter combinations for the Push-Response strategy."""
+
+    def generate_combinations(self) -> Iterator[Tuple[Dict, Dict]]:
+        taus = self.params.get("pr_tau_values", [5, 10, 21])
+        windows = self.params.get("pr_training_window_values", [126, 252])
+        bins = self.params.get("pr_num_bins_values", [20, 50])
+        thresholds = self.params.get("pr_threshold_values", [0.0])
+        refit_every = self.params.get("pr_refit_every", 1)
+
+        # tau varies slowest, so each sweep batch mostly shares one tau and
+        # reuses the strategy's cached push/response series for it
+        for tau, window, num_bins, threshold in itertools.product(
+            taus, windows, bins, thresholds
+        ):
+            model_params = {
+                "tau": tau,
+                "training_window": window,
+                "num_bins": num_bins,
+                "threshold": threshold,
+                "refit_every": refit_every,
+            }
             display_params = model_params.copy()
             yield model_params, display_params
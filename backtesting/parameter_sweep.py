@@ -0,0 +1,133 @@
+import math
+from typing import Dict, Iterable, List, Tuple, Type
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
+
+from alpha_models.base_model import BaseAlphaModel, shared_intermediates
+from alpha_models.moving_average_crossover import batch_sma_signals
+from backtesting.backtester import Backtester
+
+
+def _run_one(
+    price_data: pd.DataFrame,
+    model_cls: Type[BaseAlphaModel],
+    model_params: Dict,
+    display_params: Dict,
+    backtester_kwargs: Dict,
+) -> Dict:
+    """
+    Runs a single backtest for one parameter combination.
+
+    Kept at module level so it can be pickled and shipped to worker processes.
+    """
+    model = model_cls(**model_params)
+    stats = Backtester(**backtester_kwargs).run_and_get_metrics(
+        price_data=price_data, model=model
+    )
+    if stats:
+        stats.update(display_params)
+    return stats
+
+
+def _run_batch(
+    price_data: pd.DataFrame,
+    model_cls: Type[BaseAlphaModel],
+    combinations: List[Tuple[Dict, Dict]],
+    backtester_kwargs: Dict,
+) -> List[Dict]:
+    """
+    Runs a contiguous batch of trials in one worker.
+
+    All trials in the batch see the same price frame and share the
+    intermediates strategies derive from it (e.g. rolling statistics for a
+    window), which are dropped once the batch is done.
+    """
+    with shared_intermediates():
+        return [
+            _run_one(
+                price_data, model_cls, model_params, display_params, backtester_kwargs
+            )
+            for model_params, display_params in combinations
+        ]
+
+
+def run_parameter_sweep(
+    price_data: pd.DataFrame,
+    model_cls: Type[BaseAlphaModel],
+    combinations: Iterable[Tuple[Dict, Dict]],
+    n_jobs: int = -1,
+    **backtester_kwargs,
+) -> List[Dict]:
+    """
+    Backtests a strategy over every parameter combination, in parallel.
+
+    Each combination is an independent backtest, so the trials are spread
+    across worker processes with joblib (one per core by default). Each worker
+    gets one contiguous batch; since generators vary the last parameter
+    fastest, neighbouring trials share their leading parameters and whatever
+    the strategy caches for them.
+
+    Args:
+        price_data: The price history to backtest on, with a 'Close' column.
+        model_cls: The BaseAlphaModel subclass to instantiate for each trial.
+        combinations: (model_params, display_params) pairs, as yielded by a
+                      BaseParameterGenerator.
+        n_jobs: Number of worker processes; -1 uses all cores, 1 runs serially.
+        **backtester_kwargs: Passed through to each trial's Backtester.
+
+    Returns:
+        A list of metrics dicts (merged with the display params), in the
+        order of `combinations`, skipping trials that produced no metrics.
+    """
+    combinations = list(combinations)
+    batch_size = max(1, math.ceil(len(combinations) / effective_n_jobs(n_jobs)))
+    batches = Parallel(n_jobs=n_jobs)(
+        delayed(_run_batch)(
+            price_data,
+            model_cls,
+            combinations[start : start + batch_size],
+            backtester_kwargs,
+        )
+        for start in range(0, len(combinations), batch_size)
+    )
+    return [stats for batch in batches for stats in batch if stats]
+
+
+def run_ma_crossover_sweep(
+    price_data: pd.DataFrame,
+    grid: Dict[str, np.ndarray],
+    **backtester_kwargs,
+) -> List[Dict]:
+    """
+    Backtests the Moving Average Crossover strategy over a whole window grid.
+
+    Instead of instantiating one strategy per combination, every pair's
+    signals are computed in one batched pass that shares each distinct
+    window's moving average, and the backtests replay those signal rows.
+
+    Args:
+        price_data: The price history to backtest on, with a 'Close' column.
+        grid: Aligned 'short_window' and 'long_window' arrays, as returned by
+              MACrossoverParameterGenerator.generate_grid().
+        **backtester_kwargs: Passed through to the Backtester.
+
+    Returns:
+        A list of metrics dicts (merged with the pair's windows), in grid
+        order, skipping pairs that produced no metrics.
+    """
+    shorts, longs = grid["short_window"], grid["long_window"]
+    signals = batch_sma_signals(
+        price_data["Close"].to_numpy(dtype=np.float64), shorts, longs
+    )
+    backtester = Backtester(**backtester_kwargs)
+    results = []
+    for portfolio, short_window, long_window in zip(
+        backtester.run_batch(price_data, signals), shorts.tolist(), longs.tolist()
+    ):
+        stats = backtester.get_performance_metrics(portfolio)
+        if stats:
+            stats.update({"short_window": short_window, "long_window": long_window})
+            results.append(stats)
+    return results
@@ -1,11 +1,17 @@
+from dataclasses import fields
+
 import numpy as np
 import pandas as pd
 
 from analysis.performance_analyzer import PerformanceAnalyzer
 from execution.simulated_handler import SimulatedExecutionHandler
-from .events import OrderEvent
+from .events import Direction, FillEvent, OrderEvent
 from .risk_manager import PortfolioRiskManager
 
+# The trade log is kept as one list per FillEvent field (struct of arrays)
+# rather than a list of dicts, so building its DataFrame is a column copy
+_TRADE_LOG_COLUMNS = tuple(field.name for field in fields(FillEvent))
+
 
 class PortfolioBacktester:
     """
@@ -36,163 +42,197 @@ class PortfolioBacktester:
             target_weights: A dictionary mapping tickers to their target weights.
         """
         # --- 1. ARCHITECTURAL REFACTOR: Create an event-driven loop ---
-        # Get all unique timestamps from all signal sources. This is more efficient
-        # than iterating over every calendar day.
-        all_signal_dates = set()
-        for signal_df in signals_data.values():
-            all_signal_dates.update(signal_df.index)
-
-        # Combine all price data indices to create the master timeline for the portfolio
-        all_price_dates = set()
-        for price_df in price_data.values():
-            all_price_dates.update(price_df.index)
-
-        # The full timeline is the union of all price and signal dates, sorted.
-        full_timeline = sorted(list(all_price_dates.union(all_signal_dates)))
-
-        if not full_timeline:
-            # If there are no dates at all, return an empty result.
+        # The full timeline is the union of all price dates, sorted. It is
+        # built as one DatetimeIndex, so that every price and signal column
+        # can be aligned to it once and the loop can work on bar positions
+        # instead of timestamps. Signals are mapped onto it in `_signal_on`.
+        price_indexes = [price_df.index for price_df in price_data.values()]
+        full_timeline = (
+            pd.DatetimeIndex(price_indexes[0].append(price_indexes[1:]))
+            .unique()
+            .sort_values()
+            if price_indexes
+            else pd.DatetimeIndex([])
+        )
+
+        if full_timeline.empty:
+            # If there are no price dates at all, return an empty result.
             return pd.DataFrame(), pd.DataFrame()
 
         # --- 2. Initialize Portfolio State ---
         all_tickers = list(price_data.keys())
-        portfolio = pd.DataFrame(index=full_timeline)
-        portfolio["cash"] = self.initial_capital
-        portfolio["holdings_value"] = 0.0
-        portfolio["total"] = self.initial_capital
-        for ticker in all_tickers:
-            portfolio[f"{ticker}_pos"] = 0.0
+        num_bars, num_tickers = len(full_timeline), len(all_tickers)
+
+        # Each ticker's close as of every bar, i.e. its most recent close if
+        # the bar is a holiday for it, and 0 (no price) before its history
+        # starts, looked up for the whole timeline at once
+        close_prices = np.zeros((num_bars, num_tickers), dtype=np.float64)
+        for k, ticker in enumerate(all_tickers):
+            close_prices[:, k] = (
+                price_data[ticker]["Close"]
+                .reindex(full_timeline, method="ffill", fill_value=0.0)
+                .to_numpy(dtype=np.float64)
+            )
 
-        trade_log = []
+        # Each ticker's signal on every bar (0 where it has none), with the
+        # portfolio-level signal, where non-zero, taking precedence
+        signals = np.zeros((num_bars, num_tickers), dtype=np.float64)
+        for k, ticker in enumerate(all_tickers):
+            if ticker in signals_data:
+                signals[:, k] = self._signal_on(signals_data[ticker], full_timeline)
+        if "Portfolio" in signals_data:
+            portfolio_signals = self._signal_on(
+                signals_data["Portfolio"], full_timeline
+            )[:, np.newaxis]
+            signals = np.where(portfolio_signals != 0, portfolio_signals, signals)
+        is_signal_day = (signals != 0).any(axis=1)
+
+        # The state only changes on signal days, so the loop visits just those
+        # and records the state after each; the bars in between are filled in
+        # once the loop is done.
+        position = np.zeros(num_tickers, dtype=np.float64)
+        cash = self.initial_capital
+        signal_days = np.flatnonzero(is_signal_day)
+        day_positions, day_cash = [], []
+        # Signal days are valued before their trades
+        day_holdings_value, day_total = [], []
+
+        trades = {name: [] for name in _TRADE_LOG_COLUMNS}
 
         # --- 3. Main Event Loop ---
-        # Iterate through each day in our master timeline
-        for i, timestamp in enumerate(full_timeline):
-            # Carry forward the previous day's state
-            if i > 0:
-                prev_timestamp = full_timeline[i - 1]
-                portfolio.loc[timestamp] = portfolio.loc[prev_timestamp]
+        # Iterate through the signal days in our master timeline
+        for i in signal_days:
+            timestamp = full_timeline[i]
+            current_prices = close_prices[i]
 
             # Update holdings value with current prices
-            current_holdings_value = 0.0
-            current_prices = {}
-            for ticker in all_tickers:
-                # Use asof to get the most recent price if the current timestamp is a holiday
-                price_series = price_data[ticker]["Close"]
-                price_idx = price_series.index.asof_loc(timestamp)
-                if price_idx != -1:  # asof_loc returns -1 if no valid location
-                    current_price = price_series.iloc[price_idx]
-                    current_prices[ticker] = current_price
-                    current_holdings_value += (
-                        portfolio.loc[timestamp, f"{ticker}_pos"] * current_price
-                    )
-
-            portfolio.loc[timestamp, "holdings_value"] = current_holdings_value
-            portfolio.loc[timestamp, "total"] = (
-                portfolio.loc[timestamp, "cash"] + current_holdings_value
-            )
-
-            # If the current day is not a signal day, we just update values and continue
-            if timestamp not in all_signal_dates:
-                continue
+            current_holdings_value = position @ current_prices
+            current_total = cash + current_holdings_value
 
             # --- 4. Process Signals for the Day ---
             # This logic now correctly handles both portfolio-level and ticker-level signals.
-            portfolio_signal_df = signals_data.get("Portfolio")
-            portfolio_signal = (
-                portfolio_signal_df.loc[timestamp, "signal"]
-                if portfolio_signal_df is not None
-                and timestamp in portfolio_signal_df.index
-                else 0
-            )
-
-            for ticker in all_tickers:
-                ticker_signal_df = signals_data.get(ticker)
-                ticker_signal = (
-                    ticker_signal_df.loc[timestamp, "signal"]
-                    if ticker_signal_df is not None
-                    and timestamp in ticker_signal_df.index
-                    else 0
-                )
-
-                # Combine signals (portfolio signal takes precedence if it exists)
-                signal = portfolio_signal if portfolio_signal != 0 else ticker_signal
-
-                if signal == 0:
-                    continue
-
-                current_position = portfolio.loc[timestamp, f"{ticker}_pos"]
-                current_price = current_prices.get(ticker)
+            day_signals = signals[i]
+            for k in np.flatnonzero(day_signals):
+                ticker = all_tickers[k]
+                signal = day_signals[k]
+                current_position = position[k]
+                current_price = current_prices[k]
                 order = None
 
-                if not current_price or pd.isna(current_price):
+                if current_price == 0 or np.isnan(current_price):
                     continue
 
                 # --- Signal Execution Logic ---
-                if signal == 1 and np.isclose(current_position, 0):  # Directional Buy
-                    target_value = portfolio.loc[
-                        timestamp, "total"
-                    ] * target_weights.get(ticker, 0)
+                # Positions hold whole shares, so an empty one is exactly 0
+                if signal == 1 and current_position == 0:  # Directional Buy
+                    target_value = current_total * target_weights.get(ticker, 0)
                     quantity = int(target_value / current_price)
                     if quantity > 0:
-                        order = OrderEvent(timestamp, ticker, "MKT", quantity, "BUY")
+                        order = OrderEvent(
+                            timestamp, ticker, "MKT", quantity, Direction.BUY
+                        )
 
                 elif signal == -1 and current_position > 0:  # Directional Sell
                     order = OrderEvent(
-                        timestamp, ticker, "MKT", int(current_position), "SELL"
+                        timestamp, ticker, "MKT", int(current_position), Direction.SELL
                     )
 
                 elif signal == 2:  # Rebalance Signal
-                    target_value = portfolio.loc[
-                        timestamp, "total"
-                    ] * target_weights.get(ticker, 0)
+                    target_value = current_total * target_weights.get(ticker, 0)
                     target_quantity = int(target_value / current_price)
                     trade_quantity = target_quantity - current_position
 
                     if trade_quantity > 0:
                         order = OrderEvent(
-                            timestamp, ticker, "MKT", int(trade_quantity), "BUY"
+                            timestamp, ticker, "MKT", int(trade_quantity), Direction.BUY
                         )
                     elif trade_quantity < 0:
                         order = OrderEvent(
-                            timestamp, ticker, "MKT", int(abs(trade_quantity)), "SELL"
+                            timestamp,
+                            ticker,
+                            "MKT",
+                            int(abs(trade_quantity)),
+                            Direction.SELL,
                         )
 
                 if not order:
                     continue
 
                 # --- 5. Risk and Execution ---
-                portfolio.loc[timestamp, f"{order.symbol}_price"] = current_prices[
-                    ticker
-                ]
                 approved_order = self.risk_manager.assess_order(
-                    order, portfolio.loc[timestamp]
+                    order, current_total, current_price
                 )
                 if not approved_order:
                     continue
 
                 fill_event = self.execution_handler.execute_order(
-                    approved_order, current_prices[ticker]
+                    approved_order, current_price
                 )
 
                 if fill_event:
-                    if fill_event.direction == "BUY":
-                        portfolio.loc[timestamp, "cash"] -= fill_event.total_cost
-                        portfolio.loc[timestamp, f"{ticker}_pos"] += fill_event.quantity
-                    elif fill_event.direction == "SELL":
-                        portfolio.loc[timestamp, "cash"] += fill_event.total_cost
-                        portfolio.loc[timestamp, f"{ticker}_pos"] -= fill_event.quantity
-                    trade_log.append(vars(fill_event))
+                    # A buy pays its total cost and a sell receives it
+                    cash -= fill_event.direction * fill_event.total_cost
+                    position[k] += fill_event.direction * fill_event.quantity
+                    for name in _TRADE_LOG_COLUMNS:
+                        trades[name].append(getattr(fill_event, name))
+
+            day_positions.append(position.copy())
+            day_cash.append(cash)
+            day_holdings_value.append(current_holdings_value)
+            day_total.append(current_total)
 
         # --- Final Calculations ---
+        # Each bar carries the state set on the most recent signal day at or
+        # before it, marked to market at its own prices
+        segment = np.searchsorted(signal_days, np.arange(num_bars), side="right")
+        positions = np.vstack([np.zeros(num_tickers)] + day_positions)[segment]
+        cash = np.r_[self.initial_capital, day_cash][segment]
+        holdings_value = np.einsum("ij,ij->i", positions, close_prices)
+        total = cash + holdings_value
+        holdings_value[signal_days] = day_holdings_value
+        total[signal_days] = day_total
+
+        portfolio = pd.DataFrame(
+            {
+                "cash": cash,
+                "holdings_value": holdings_value,
+                "total": total,
+                **{
+                    f"{ticker}_pos": positions[:, k]
+                    for k, ticker in enumerate(all_tickers)
+                },
+            },
+            index=full_timeline,
+        )
         portfolio["returns"] = portfolio["total"].pct_change().fillna(0)
         self.results = portfolio
 
-        return portfolio, pd.DataFrame(trade_log)
+        trade_log = pd.DataFrame(trades) if trades["timestamp"] else pd.DataFrame()
+        return portfolio, trade_log
+
+    @staticmethod
+    def _signal_on(signal_df: pd.DataFrame, timeline: pd.DatetimeIndex) -> np.ndarray:
+        """
+        Maps a signals DataFrame onto the price timeline in one pass.
+
+        Each non-zero signal lands on the first bar at or after its date, so
+        a signal issued on a day without prices is acted on at the next bar
+        (the latest one wins if several land on the same bar) and signals
+        after the last bar are dropped. Bars without a signal get 0.
+        """
+        signal = signal_df["signal"]
+        signal = signal[signal.to_numpy() != 0]
+        bars = timeline.searchsorted(signal.index)
+        on_timeline = bars < len(timeline)
+        values = np.zeros(len(timeline), dtype=np.float64)
+        values[bars[on_timeline]] = signal.to_numpy(np.float64)[on_timeline]
+        return values
 
     def get_performance_metrics(self) -> dict:
         """Calculates performance metrics by delegating to the PerformanceAnalyzer."""
         if self.results is None or self.results.empty:
             return {}
-        analyzer = PerformanceAnalyzer(self.results, self.initial_capital)
+        analyzer = PerformanceAnalyzer(
+            self.results, initial_capital=self.initial_capital
+        )
         return analyzer.calculate_all_metrics()
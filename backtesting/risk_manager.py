@@ -1,6 +1,6 @@
-import pandas as pd
+from dataclasses import replace
 
-from .events import OrderEvent
+from .events import Direction, OrderEvent
 
 
 class PortfolioRiskManager:
@@ -32,7 +32,7 @@ class PortfolioRiskManager:
         self.high_water_mark = 0.0
 
     def assess_order(
-        self, order: OrderEvent, portfolio_state: pd.Series
+        self, order: OrderEvent, portfolio_equity: float, price: float
     ) -> OrderEvent | None:
         """
         Assesses a proposed order against the portfolio's risk rules.
@@ -42,40 +42,33 @@ class PortfolioRiskManager:
 
         Args:
             order: The proposed OrderEvent.
-            portfolio_state: A pandas Series representing the current state of the portfolio.
-                             Must include 'total' equity.
+            portfolio_equity: The portfolio's current total equity.
+            price: The current market price of the order's symbol.
 
         Returns:
             The approved (and potentially down-sized) OrderEvent, or None if
             the order is rejected.
         """
-        portfolio_equity = portfolio_state["total"]
-
         # 1. Update High-Water Mark
         if portfolio_equity > self.high_water_mark:
             self.high_water_mark = portfolio_equity
 
+        # Sell orders only reduce exposure, so they are approved as they are
+        if order.direction != Direction.BUY:
+            return order
+
         # 2. Check for Max Drawdown Breach
         drawdown = (self.high_water_mark - portfolio_equity) / self.high_water_mark
         if drawdown > self.max_portfolio_drawdown_pct:
-            # Halt all new buy orders if drawdown is breached
-            if order.direction == "BUY":
-                return None
-
-        # 3. Enforce Max Risk Per Trade (for BUY orders)
-        if order.direction == "BUY":
-            max_trade_value = portfolio_equity * self.max_trade_risk_pct
-            proposed_trade_value = (
-                order.quantity * portfolio_state[f"{order.symbol}_price"]
-            )  # Assumes price is in state
+            return None  # Halt all new buy orders if drawdown is breached
 
-            if proposed_trade_value > max_trade_value:
-                # Scale down the order to meet the risk limit
-                new_quantity = int(
-                    max_trade_value / portfolio_state[f"{order.symbol}_price"]
-                )
-                if new_quantity == 0:
-                    return None  # Trade is too small to execute
-                order.quantity = new_quantity
+        # 3. Enforce Max Risk Per Trade
+        max_trade_value = portfolio_equity * self.max_trade_risk_pct
+        if order.quantity * price > max_trade_value:
+            # Scale down the order to meet the risk limit
+            new_quantity = int(max_trade_value / price)
+            if new_quantity == 0:
+                return None  # Trade is too small to execute
+            order = replace(order, quantity=new_quantity)
 
         return order
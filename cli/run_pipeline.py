@@ -1,8 +1,11 @@
 import argparse
 import logging
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from curl_cffi import requests
+
 # --- Project Imports ---
 from config.settings import DB_PATH, DEFAULT_START_DATE
 from dashboard_app.database_manager import DatabaseManager
@@ -18,6 +21,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Connection settings for the pipeline's bulk writes and reads. WAL lets the
+# dashboard keep reading while the pipeline writes, and with it NORMAL
+# synchronisation is still safe against corruption.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-262144",  # 256 MiB page cache
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # Memory-map up to 256 MiB of the file
+)
+
 
 class PipelineOrchestrator:
     """
@@ -25,11 +39,18 @@ class PipelineOrchestrator:
     universe of assets to fetching and storing their data.
     """
 
-    def __init__(self, conn: sqlite3.Connection):
+    def __init__(self, conn: sqlite3.Connection, session: requests.Session = None):
         """
         Initializes the orchestrator with a database connection.
+
+        Args:
+            conn: The database connection shared by every step.
+            session: The curl_cffi HTTP session shared by every Yahoo Finance
+                     request, so that they reuse its connections and cookies.
+                     If None, one impersonating Chrome is created.
         """
         self.conn = conn
+        self.session = session or requests.Session(impersonate="chrome")
         self.db_manager = DatabaseManager(db_path=None, conn=self.conn)
         # Ensure all necessary tables exist before running.
         self._setup_database()
@@ -39,6 +60,9 @@ class PipelineOrchestrator:
         Ensures all necessary tables are created by their respective managers.
         This is a key part of the new design.
         """
+        # Tune whichever connection the orchestrator was given for bulk writes
+        for pragma in _SQLITE_PRAGMAS:
+            self.conn.execute(pragma)
         logger.info("Ensuring all necessary database tables exist...")
         self.db_manager.create_tables()  # Handles price_data, universe_metadata, etc.
         FundamentalPipeline.create_table(self.conn)
@@ -68,31 +92,47 @@ class PipelineOrchestrator:
             f"Discovered tickers in database: {len(equities)} equities, {len(cryptos)} cryptos."
         )
 
-        # 3. Run the Equity Price Pipeline.
-        if equities:
-            logger.info("--- Starting Equity Price Pipeline ---")
-            equity_pipeline = EquityPipeline(equities, start_date, end_date, None)
-            equity_data = equity_pipeline.fetch_batch_data()
-            if not equity_data.empty:
-                self.db_manager.write_price_data(equity_data)
-            logger.info("--- Equity Price Pipeline Complete ---")
-
-        # 4. Run the Crypto Price Pipeline.
-        if cryptos:
-            logger.info("--- Starting Crypto Price Pipeline ---")
-            crypto_pipeline = CryptoPipeline(cryptos, start_date, end_date, None)
-            crypto_data = crypto_pipeline.fetch_batch_data()
-            if not crypto_data.empty:
-                self.db_manager.write_price_data(crypto_data)
-            logger.info("--- Crypto Price Pipeline Complete ---")
-
-        # 5. Run the Fundamental Data Pipeline (only for equities).
-        if equities:
-            logger.info("--- Starting Fundamental Data Pipeline ---")
-            FundamentalPipeline.fetch_and_write_fundamentals(
-                tickers=equities, conn=self.conn
-            )
-            logger.info("--- Fundamental Data Pipeline Complete ---")
+        # Fundamentals come from a different Yahoo endpoint than the price
+        # downloads, so they are fetched in the background while the price
+        # pipelines run. The price downloads stay sequential (yf.download keeps
+        # module-level state), and every write stays on this thread, which
+        # owns the connection.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            fundamentals = None
+            if equities:
+                logger.info("--- Starting Fundamental Data Pipeline ---")
+                fundamentals = executor.submit(
+                    FundamentalPipeline.fetch_fundamentals,
+                    equities,
+                    session=self.session,
+                )
+
+            # 3. Run the Equity Price Pipeline.
+            if equities:
+                logger.info("--- Starting Equity Price Pipeline ---")
+                equity_pipeline = EquityPipeline(
+                    equities, start_date, end_date, self.session
+                )
+                equity_data = equity_pipeline.fetch_batch_data()
+                if not equity_data.empty:
+                    self.db_manager.write_price_data(equity_data)
+                logger.info("--- Equity Price Pipeline Complete ---")
+
+            # 4. Run the Crypto Price Pipeline.
+            if cryptos:
+                logger.info("--- Starting Crypto Price Pipeline ---")
+                crypto_pipeline = CryptoPipeline(
+                    cryptos, start_date, end_date, self.session
+                )
+                crypto_data = crypto_pipeline.fetch_batch_data()
+                if not crypto_data.empty:
+                    self.db_manager.write_price_data(crypto_data)
+                logger.info("--- Crypto Price Pipeline Complete ---")
+
+            # 5. Write the Fundamental Data (only for equities).
+            if fundamentals is not None:
+                FundamentalPipeline.write_fundamentals(fundamentals.result(), self.conn)
+                logger.info("--- Fundamental Data Pipeline Complete ---")
 
         logger.info("✅ Main data pipeline run completed successfully!")
 
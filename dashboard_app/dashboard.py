@@ -34,6 +34,10 @@ try:
         MACrossoverParameterGenerator,
         MeanReversionParameterGenerator,
     )
+    from backtesting.parameter_sweep import (
+        run_ma_crossover_sweep,
+        run_parameter_sweep,
+    )
     from alpha_models.base_model import BaseAlphaModel
     from alpha_models.buy_and_hold import BuyAndHoldStrategy
     from alpha_models.mean_reversion import MeanReversionStrategy
@@ -77,6 +81,8 @@ except ImportError as e:
         PortfolioOptimizer,
         MACrossoverParameterGenerator,
         MeanReversionParameterGenerator,
+        run_ma_crossover_sweep,
+        run_parameter_sweep,
         BaseAlphaModel,
         BuyAndHoldStrategy,
         MeanReversionStrategy,
@@ -90,7 +96,7 @@ except ImportError as e:
         PrincipalComponentAnalyzer,
         StatisticalAnalyzer,
         RiskManager,
-    ) = (None,) * 31
+    ) = (None,) * 33
     st.error(
         f"🚨 FAILED TO IMPORT A MODULE. Please ensure all project components are in place. Error: {e}"
     )
@@ -538,27 +544,24 @@ class DashboardApp:
 
             if strategy_type == "Mean Reversion":
                 param_generator = MeanReversionParameterGenerator(self.selections)
+                model_cls = MeanReversionStrategy
             elif strategy_type == "Moving Average Crossover":
                 param_generator = MACrossoverParameterGenerator(self.selections)
+                model_cls = MovingAverageCrossoverStrategy
             else:
                 st.error(f"Optimization is not supported for '{strategy_type}'.")
                 return
 
-            param_results = []
-            backtester = Backtester()
-            for (
-                model_params,
-                display_params,
-            ) in param_generator.generate_combinations():
-                model = self._create_strategy_model(model_params)
-                if not model:
-                    continue
-                stats = backtester.run_and_get_metrics(
-                    price_data=backtest_data, model=model
+            if strategy_type == "Moving Average Crossover":
+                # The whole window grid shares one batched signal pass
+                param_results = run_ma_crossover_sweep(
+                    backtest_data, param_generator.generate_grid()
+                )
+            else:
+                # Each combination is an independent backtest, run across all cores
+                param_results = run_parameter_sweep(
+                    backtest_data, model_cls, param_generator.generate_combinations()
                 )
-                if stats:
-                    stats.update(display_params)
-                    param_results.append(stats)
             st.session_state.optimization_run = {
                 "results": pd.DataFrame(param_results),
                 "metric": self.selections["optimize_metric"],
@@ -679,21 +682,24 @@ class DashboardApp:
         )
         if price_df.empty:
             # --- FIX: Add diagnostic check to provide a more helpful error message ---
-            missing_from_db = []
             conn = self.db_manager._get_connection()
-            for ticker in tickers_to_fetch:
-                try:
-                    # Check if at least one row exists for the ticker in the price table
-                    check_df = pd.read_sql(
-                        "SELECT 1 FROM price_data_daily WHERE Ticker = ? LIMIT 1",
-                        conn,
-                        params=(ticker,),
-                    )
-                    if check_df.empty:
-                        missing_from_db.append(ticker)
-                except Exception:
-                    # In case of a broader DB issue, add to list to be safe
-                    missing_from_db.append(ticker)
+            placeholders = ", ".join("?" for _ in tickers_to_fetch)
+            try:
+                # Find which tickers have at least one row in the price table,
+                # for all of them in one query
+                check_df = pd.read_sql(
+                    "SELECT DISTINCT Ticker FROM price_data_daily "
+                    f"WHERE Ticker IN ({placeholders})",
+                    conn,
+                    params=tickers_to_fetch,
+                )
+                stored_tickers = set(check_df["Ticker"])
+            except Exception:
+                # In case of a broader DB issue, treat them all as missing to be safe
+                stored_tickers = set()
+            missing_from_db = [
+                ticker for ticker in tickers_to_fetch if ticker not in stored_tickers
+            ]
 
             if missing_from_db:
                 # This error means the data pipeline has likely not been run for these tickers.
@@ -733,7 +739,7 @@ class DashboardApp:
         benchmark_returns = price_df[benchmark_symbol].pct_change()
         results = {
             symbol: self.statistical_analyzer.run_ols_regression(
-                asset_returns[symbol], benchmark_returns
+                asset_returns[symbol], benchmark_returns, include_summary=True
             )
             for symbol in selected_symbols
         }
@@ -772,12 +778,9 @@ class DashboardApp:
     def _run_kalman_filter(self):
         """Runs the Kalman Filter smoother on selected assets."""
         price_df, selected_symbols, _ = self._get_test_data()
-        results = {
-            symbol: self.statistical_analyzer.run_kalman_filter_smoother(
-                price_df[symbol]
-            )
-            for symbol in selected_symbols
-        }
+        results = self.statistical_analyzer.run_kalman_filter_smoother_many(
+            price_df[selected_symbols]
+        )
         return results, None
 
     def _run_pca(self):
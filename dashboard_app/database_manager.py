@@ -92,6 +92,13 @@ class DatabaseManager:
                     );
                     """
                 )
+                # The primary keys lead with Timestamp, so per-ticker reads
+                # (WHERE Ticker = ? / IN (...)) need their own index
+                for table_name in ("price_data_daily", "price_data_hourly"):
+                    conn.execute(
+                        f"CREATE INDEX IF NOT EXISTS idx_{table_name}_ticker "
+                        f"ON {table_name} (Ticker, Timestamp)"
+                    )
                 # Table for user-generated research notes
                 conn.execute(
                     """
@@ -198,7 +198,8 @@ class StatisticalAnalysisTab:
         with st.expander("Show Full Model Summaries"):
             for symbol, res in results.items():
                 st.text(f"--- {symbol} vs {benchmark} ---")
-                st.text(res["summary"])
+                # The report is formatted on demand
+                st.text(res["summary"]())
 
     def _render_engle_granger_results(self, results: dict):
         """Displays the results of an Engle-Granger Cointegration test."""
@@ -33,7 +33,9 @@ class CryptoPipeline:
                      This should come from the 'symbol' field of the CoinGecko API.
             start_date: The start date for data fetching (YYYY-MM-DD).
             end_date: The end date for data fetching (YYYY-MM-DD).
-            session: A requests.Session object.
+            session: A curl_cffi requests.Session passed on to yfinance, so that all
+                     downloads reuse its connections and cookies. If None, yfinance
+                     uses its own.
         """
         if not isinstance(tickers, list) or not tickers:
             raise ValueError("A non-empty list of tickers must be provided.")
@@ -74,6 +76,7 @@ class CryptoPipeline:
                 progress=False,
                 threads=True,
                 auto_adjust=True,  # Recommended to simplify data by removing Adj. Close
+                session=self.session,
             )
         except Exception as e:
             logger.error(f"An error occurred during yfinance download for crypto: {e}")
@@ -95,7 +98,11 @@ class CryptoPipeline:
         logger.info("Fetching crypto benchmark data (BTC-USD) for beta calculation...")
         try:
             btc_data = yf.download(
-                "BTC-USD", start=self.start_date, end=self.end_date, auto_adjust=True
+                "BTC-USD",
+                start=self.start_date,
+                end=self.end_date,
+                auto_adjust=True,
+                session=self.session,
             )
             if btc_data.empty:
                 logger.warning(
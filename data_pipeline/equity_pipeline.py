@@ -30,8 +30,9 @@ class EquityPipeline:
             tickers: A list of equity ticker symbols.
             start_date: The start date for data fetching (YYYY-MM-DD).
             end_date: The end date for data fetching (YYYY-MM-DD).
-            session: A requests.Session object. Note: yfinance uses its own HTTP client,
-                     so this session is not directly used for fetching but is kept for API consistency.
+            session: A curl_cffi requests.Session passed on to yfinance, so that all
+                     downloads reuse its connections and cookies. If None, yfinance
+                     uses its own.
         """
         if not isinstance(tickers, list) or not tickers:
             raise ValueError("A non-empty list of tickers must be provided.")
@@ -61,6 +62,7 @@ class EquityPipeline:
                 end=self.end_date,
                 progress=False,
                 auto_adjust=True,
+                session=self.session,
             )
         except Exception as e:
             logger.error(f"An error occurred during yfinance download: {e}")
@@ -83,7 +85,11 @@ class EquityPipeline:
         logger.info("Fetching benchmark data (SPY) for beta calculation...")
         try:
             spy_data = yf.download(
-                "SPY", start=self.start_date, end=self.end_date, auto_adjust=True
+                "SPY",
+                start=self.start_date,
+                end=self.end_date,
+                auto_adjust=True,
+                session=self.session,
             )
             if spy_data.empty:
                 logger.warning(
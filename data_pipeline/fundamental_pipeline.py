@@ -1,8 +1,11 @@
 import logging
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 import pandas as pd
 import yfinance as yf
+from curl_cffi import requests
 
 # Each module gets its own logger.
 logger = logging.getLogger(__name__)
@@ -39,47 +42,83 @@ class FundamentalPipeline:
             raise
 
     @staticmethod
-    def fetch_and_write_fundamentals(tickers: list[str], conn: sqlite3.Connection):
+    def _fetch_fundamentals(
+        ticker_symbol: str, session: requests.Session = None
+    ) -> dict | None:
+        """Fetches one ticker's fundamentals, or returns None if that fails."""
+        try:
+            info = yf.Ticker(ticker_symbol, session=session).info
+
+            # Extract data safely, providing None as a default
+            data_point = {
+                "Ticker": ticker_symbol,
+                "MarketCap": info.get("marketCap"),
+                "TrailingPE": info.get("trailingPE"),
+                "ForwardPE": info.get("forwardPE"),
+                "EnterpriseValue": info.get("enterpriseValue"),
+                "BookValue": info.get("bookValue"),
+            }
+            logger.debug(f"Successfully fetched fundamental data for {ticker_symbol}.")
+            return data_point
+
+        except Exception as e:
+            # Log a warning for individual failures; the other tickers carry on
+            logger.warning(
+                f"Could not fetch or process fundamental data for {ticker_symbol}: {e}"
+            )
+            return None
+
+    @staticmethod
+    def fetch_fundamentals(
+        tickers: list[str],
+        max_workers: int = 16,
+        session: requests.Session = None,
+    ) -> pd.DataFrame:
         """
-        Fetches fundamental data for a list of tickers and writes it to the database.
+        Fetches fundamental data for a list of tickers.
+
+        Each ticker is a separate, network-bound request, so the requests are
+        spread over a pool of threads. Nothing touches the database, so this
+        can run on any thread.
+
+        Args:
+            tickers: The ticker symbols to fetch.
+            max_workers: The maximum number of concurrent requests.
+            session: An optional curl_cffi requests.Session shared by all the
+                     requests. If None, yfinance uses its own.
+
+        Returns:
+            One row per ticker that was fetched successfully, in the order of
+            `tickers`; empty if none were.
         """
         logger.info(f"Starting fundamental data fetch for {len(tickers)} tickers.")
-        fundamental_data = []
-
-        for ticker_symbol in tickers:
-            try:
-                ticker_obj = yf.Ticker(ticker_symbol)
-                info = ticker_obj.info
-
-                # Extract data safely, providing None as a default
-                data_point = {
-                    "Ticker": ticker_symbol,
-                    "MarketCap": info.get("marketCap"),
-                    "TrailingPE": info.get("trailingPE"),
-                    "ForwardPE": info.get("forwardPE"),
-                    "EnterpriseValue": info.get("enterpriseValue"),
-                    "BookValue": info.get("bookValue"),
-                }
-                fundamental_data.append(data_point)
-                logger.debug(
-                    f"Successfully fetched fundamental data for {ticker_symbol}."
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            fundamental_data = [
+                data_point
+                for data_point in executor.map(
+                    partial(FundamentalPipeline._fetch_fundamentals, session=session),
+                    tickers,
                 )
+                if data_point is not None
+            ]
+        return pd.DataFrame(fundamental_data)
 
-            except Exception as e:
-                # Log a warning for individual failures but continue the loop
-                logger.warning(
-                    f"Could not fetch or process fundamental data for {ticker_symbol}: {e}"
-                )
-                continue
+    @staticmethod
+    def write_fundamentals(df: pd.DataFrame, conn: sqlite3.Connection):
+        """
+        Upserts fetched fundamental data into the database.
 
-        if not fundamental_data:
+        Args:
+            df: Fundamentals as returned by `fetch_fundamentals`.
+            conn: An active sqlite3 database connection, used from the thread
+                  that created it.
+        """
+        if df.empty:
             logger.warning(
                 "No fundamental data was successfully fetched. Aborting database write."
             )
             return
 
-        # Convert to DataFrame and write to the database
-        df = pd.DataFrame(fundamental_data)
         logger.info(
             f"Preparing to write fundamental data for {len(df)} tickers to the database."
         )
@@ -107,3 +146,27 @@ class FundamentalPipeline:
         except sqlite3.Error as e:
             # Log the full exception traceback for database errors
             logger.exception(f"❌ Failed to write fundamental data to database: {e}")
+
+    @staticmethod
+    def fetch_and_write_fundamentals(
+        tickers: list[str],
+        conn: sqlite3.Connection,
+        max_workers: int = 16,
+        session: requests.Session = None,
+    ):
+        """
+        Fetches fundamental data for a list of tickers and writes it to the database.
+
+        The requests run on a pool of threads and the results are written from
+        the calling thread, which owns the connection.
+
+        Args:
+            tickers: The ticker symbols to fetch.
+            conn: An active sqlite3 database connection.
+            max_workers: The maximum number of concurrent requests.
+            session: An optional curl_cffi requests.Session shared by all the
+                     requests. If None, yfinance uses its own.
+        """
+        FundamentalPipeline.write_fundamentals(
+            FundamentalPipeline.fetch_fundamentals(tickers, max_workers, session), conn
+        )
@@ -44,16 +44,12 @@ class TimeSeriesNormalizer:
 
             # Use groupby().transform('first') to get the first 'Close' value for each ticker
             # This efficiently broadcasts the first value to all rows of the group.
-            df["FirstValue"] = df.groupby("Ticker")["Close"].transform("first")
+            first_values = df.groupby("Ticker")["Close"].transform("first")
 
-            # Normalize the 'Close' price, handling potential division by zero
-            df["Normalized"] = df.apply(
-                lambda row: (
-                    (row["Close"] / row["FirstValue"]) * 100
-                    if row["FirstValue"] != 0
-                    else 0
-                ),
-                axis=1,
+            # Normalize the 'Close' price as one column operation, using 0 where
+            # the first value is 0 to avoid a division by zero
+            df["Normalized"] = ((df["Close"] / first_values) * 100).where(
+                first_values != 0, 0.0
             )
 
             # Select and rename columns for the final table
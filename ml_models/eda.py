@@ -1,6 +1,5 @@
 import sqlite3
 
-import matplotlib.pyplot as plt
 import pandas as pd
 
 
@@ -85,6 +84,9 @@ class EDA:
         """
         if self.data is None:
             raise ValueError("Data not loaded.")
+        # Imported here so loading and cleaning data never pays for pyplot
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=(10, 6))
         plt.plot(self.data.index, self.data[column], label=column)
         plt.title(title)
@@ -0,0 +1,331 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import alpha_models
+from alpha_models import _kernels
+from alpha_models._rolling import move_mean, move_std
+from alpha_models import mean_reversion
+from alpha_models.base_model import shared_intermediates
+from alpha_models.basket_trading import BasketTradingStrategy
+from alpha_models.cointegrated_mean_reversion import CointegratedMeanReversionStrategy
+from alpha_models.index_rebalancing import IndexRebalancingStrategy
+from alpha_models.mean_reversion import MeanReversionStrategy
+from alpha_models.moving_average_crossover import MovingAverageCrossoverStrategy
+from alpha_models.pairs_trading import PairsTradingStrategy
+from alpha_models.push_response_strategy import PushResponseStrategy
+
+
+def create_price_data(num_periods: int = 300, seed: int = 42) -> pd.DataFrame:
+    """Creates a sample DataFrame of two random-walk price series."""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2022-01-03", periods=num_periods, freq="B")
+    prices = 100 + np.cumsum(rng.normal(size=(num_periods, 2)), axis=0)
+    return pd.DataFrame(prices, index=dates, columns=["AAA", "BBB"])
+
+
+def test_cointegrated_holds_positions_until_mean_cross():
+    """
+    Tests that the compiled spread kernel enters beyond the Z-score threshold
+    and holds the position until the spread crosses back over its mean.
+    """
+    price_data = create_price_data()
+    weights = {"AAA": 1.0, "BBB": -0.8}
+    model = CointegratedMeanReversionStrategy(weights, window=20, threshold=1.0)
+
+    signals = model.generate_signals(price_data)["signal"]
+
+    spread = price_data["AAA"] * 1.0 + price_data["BBB"] * -0.8
+    z_score = (spread - spread.rolling(20).mean()) / spread.rolling(20).std()
+    previous = signals.shift(1, fill_value=0)
+
+    assert signals.index.equals(price_data.index)
+    # No position can be opened before the first full window
+    assert (signals.iloc[:19] == 0).all()
+    # Entries happen only on oversold (long) or overbought (short) bars
+    assert (z_score[(signals == 1) & (previous != 1)] < -1.0).all()
+    assert (z_score[(signals == -1) & (previous != -1)] > 1.0).all()
+    # Longs are closed only once the spread is back at or above its mean
+    assert (z_score[(previous == 1) & (signals == 0)] >= 0).all()
+    assert (z_score[(previous == -1) & (signals == 0)] <= 0).all()
+    # Positions are held through bars inside the threshold band
+    assert ((signals != 0) & (z_score.abs() <= 1.0)).any()
+
+
+def test_cointegrated_ignores_tickers_missing_from_prices():
+    """Tests that weights for tickers absent from the price data are ignored."""
+    price_data = create_price_data()
+    with_extra = CointegratedMeanReversionStrategy(
+        {"AAA": 1.0, "BBB": -0.8, "ZZZ": 3.0}
+    ).generate_signals(price_data)
+    without_extra = CointegratedMeanReversionStrategy(
+        {"AAA": 1.0, "BBB": -0.8}
+    ).generate_signals(price_data)
+
+    pd.testing.assert_frame_equal(with_extra, without_extra)
+
+
+def test_cointegrated_requires_weights():
+    """Tests that an empty weights dictionary is rejected."""
+    with pytest.raises(ValueError, match="Weights dictionary cannot be empty"):
+        CointegratedMeanReversionStrategy({})
+
+
+def test_mean_reversion_signals_follow_oversold_state():
+    """
+    Tests that the fused kernel emits the diff of the long/flat state derived
+    from the pandas rolling Z-score.
+    """
+    close = create_price_data()["AAA"]
+    price_data = close.to_frame("Close")
+    model = MeanReversionStrategy(window=20, threshold=1.0)
+
+    signals = model.generate_signals(price_data)
+
+    z_score = (close - close.rolling(20).mean()) / close.rolling(20).std()
+    expected = (z_score < -1.0).astype(float).diff().fillna(0)
+
+    assert signals.index.equals(price_data.index)
+    np.testing.assert_array_equal(signals["signal"].to_numpy(), expected.to_numpy())
+
+
+def test_mean_reversion_reuses_zscore_across_thresholds(mocker):
+    """
+    Tests that strategies sharing a window on the same price frame reuse the
+    Z-score inside a shared_intermediates() block, that the threshold is still
+    applied per strategy, and that outside one the Z-score is recomputed.
+    """
+    price_data = create_price_data()["AAA"].to_frame("Close")
+    zscore = mocker.spy(mean_reversion, "_rolling_zscore")
+
+    loose = MeanReversionStrategy(window=20, threshold=0.5)
+    strict = MeanReversionStrategy(window=20, threshold=2.5)
+    with shared_intermediates():
+        loose_signals = loose.generate_signals(price_data)["signal"]
+        strict_signals = strict.generate_signals(price_data)["signal"]
+
+    assert zscore.call_count == 1
+    assert (loose_signals != 0).sum() > (strict_signals != 0).sum()
+
+    # Outside the block, a changed 'Close' on the same frame is picked up
+    price_data["Close"] = price_data["Close"].iloc[::-1].to_numpy()
+    changed_signals = loose.generate_signals(price_data)["signal"]
+    assert zscore.call_count == 2
+    assert not changed_signals.equals(loose_signals)
+
+
+def test_ma_crossover_matches_pandas_rolling_means():
+    """
+    Tests that the fused crossover kernel matches the pandas rolling-mean
+    comparison once the long window is full, including across gaps and flat
+    stretches in the data.
+    """
+    close = create_price_data(num_periods=500)["AAA"]
+    close.iloc[[30, 31, 200]] = np.nan
+    close.iloc[300:360] = 95.0
+    price_data = close.to_frame("Close")
+    model = MovingAverageCrossoverStrategy(short_window=10, long_window=40)
+
+    signals = model.generate_signals(price_data)
+
+    short_mavg = close.rolling(10, min_periods=1).mean()
+    long_mavg = close.rolling(40, min_periods=1).mean()
+    position = (short_mavg > long_mavg).astype(float)
+    position.iloc[:39] = 0.0
+    expected = position.diff().fillna(0)
+
+    np.testing.assert_array_equal(signals["signal"].to_numpy(), expected.to_numpy())
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        BasketTradingStrategy(),
+        IndexRebalancingStrategy(),
+        MeanReversionStrategy(),
+        MovingAverageCrossoverStrategy(),
+        CointegratedMeanReversionStrategy({"AAA": 1.0, "BBB": -0.8}),
+    ],
+)
+def test_signals_are_int8(model):
+    """Tests that strategies emit compact integer signal columns."""
+    price_data = create_price_data()
+    price_data["Close"] = price_data["AAA"]
+
+    signals = model.generate_signals(price_data)
+
+    assert signals["signal"].dtype == np.int8
+
+
+def test_pairs_trading_holds_spread_position_until_exit_band():
+    """
+    Tests that a spread position opened beyond the threshold is held until the
+    Z-score reverts inside the exit band, with mirrored per-asset signals.
+    """
+    z_score = np.array([np.nan, 0.0, -2.5, -1.0, np.nan, -0.2, 2.1, 1.0, 0.4])
+
+    signal = PairsTradingStrategy._spread_signals(z_score, threshold=2.0)
+
+    # Long at -2.5, held through -1.0 and the gap, closed at -0.2; then short
+    # at 2.1, held through 1.0, closed at 0.4
+    np.testing.assert_array_equal(signal, [0, 0, 1, 0, 0, -1, -1, 0, 1])
+
+    price_data = create_price_data()
+    signals = PairsTradingStrategy(window=20, threshold=1.0).generate_signals(
+        price_data
+    )
+    assert list(signals.columns) == ["AAA", "BBB"]
+    assert (signals["AAA"] == -signals["BBB"]).all()
+
+
+def test_push_response_trades_learned_response():
+    """
+    Tests that on a strongly up-trending series, where every push is followed
+    by a positive response, the model only ever signals long, and only once
+    the first training window is available.
+    """
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(1.0 + 0.2 * rng.normal(size=300))
+    price_data = pd.DataFrame({"Close": close})
+    model = PushResponseStrategy(tau=5, training_window=60, num_bins=5)
+
+    signals = model.generate_signals(price_data)["signal"]
+
+    assert signals.dtype == np.int8
+    assert (signals.iloc[:65] == 0).all()
+    assert set(signals.iloc[65:].unique()) == {0, 1}
+
+
+@pytest.mark.parametrize("refit_every", [1, 7])
+def test_push_response_kernel_matches_walk_forward(refit_every):
+    """
+    Tests that the compiled walk-forward matches refitting the model with
+    _fit at the start of each block and predicting each bar with _predict.
+    """
+    rng = np.random.default_rng(1)
+    close = np.round(100 + np.cumsum(rng.normal(size=300)), 1)
+    tau, training_window = 5, 60
+    model = PushResponseStrategy(
+        tau=tau, training_window=training_window, num_bins=8, refit_every=refit_every
+    )
+
+    signals = model.generate_signals(pd.DataFrame({"Close": close}))["signal"]
+
+    reference = PushResponseStrategy(
+        tau=tau, training_window=training_window, num_bins=8
+    )
+    push = np.full(len(close), np.nan)
+    push[tau:] = close[tau:] - close[:-tau]
+    response = np.full(len(close), np.nan)
+    response[:-tau] = push[tau:]
+    expected = np.zeros(len(close), dtype=np.int8)
+    for i in range(training_window + tau, len(close)):
+        if (i - training_window - tau) % refit_every == 0:
+            first = i - training_window + tau
+            reference._fit(push[first : i - tau], response[first : i - tau])
+        expected[i] = reference._predict(push[i - 1])
+
+    np.testing.assert_array_equal(signals.to_numpy(), expected)
+    np.testing.assert_array_equal(
+        model.model["expected_responses"], reference.model["expected_responses"]
+    )
+
+
+def test_get_strategy_resolves_by_name():
+    """Tests that strategies are looked up case-insensitively and cached."""
+    cls = alpha_models.get_strategy("CointegratedMeanReversionStrategy")
+
+    assert cls is CointegratedMeanReversionStrategy
+    assert alpha_models.get_strategy("cointegratedmeanreversionstrategy") is cls
+
+
+def test_get_strategy_unknown_name():
+    """Tests that an unknown strategy name raises a KeyError listing the options."""
+    with pytest.raises(KeyError, match="not found"):
+        alpha_models.get_strategy("NoSuchStrategy")
+
+
+@pytest.mark.parametrize(
+    "strategy_cls", [IndexRebalancingStrategy, BasketTradingStrategy]
+)
+def test_rebalance_on_last_trading_day_of_month(strategy_cls):
+    """
+    Tests that rebalance signals land on the last trading day of each month,
+    including months whose calendar month-end falls on a weekend.
+    """
+    dates = pd.bdate_range("2020-01-01", "2020-06-15")
+    price_data = pd.DataFrame({"Close": 100.0}, index=dates)
+
+    signals = strategy_cls(rebalance_frequency="M").generate_signals(price_data)
+    rebalance_dates = signals.index[signals["signal"] == 2].strftime("%Y-%m-%d")
+
+    assert list(rebalance_dates) == [
+        "2020-01-31",
+        "2020-02-28",  # Feb 29th 2020 was a Saturday
+        "2020-03-31",
+        "2020-04-30",
+        "2020-05-29",  # May 31st 2020 was a Sunday
+        "2020-06-15",
+    ]
+    assert set(signals["signal"].unique()) == {0, 2}
+
+
+def test_rolling_helpers_match_pandas_on_flat_stretches():
+    """
+    Tests that the rolling helpers match pandas, including returning a flat
+    window's value exactly rather than with summation residue.
+    """
+    values = create_price_data(num_periods=600)["AAA"].to_numpy()
+    values[200:400] = 50.0
+    values[450] = np.nan
+    series = pd.Series(values)
+
+    mean = move_mean(values, 30)
+    std = move_std(values, 30)
+
+    np.testing.assert_allclose(mean, series.rolling(30).mean(), rtol=1e-12)
+    np.testing.assert_allclose(std, series.rolling(30).std(), rtol=1e-9, atol=1e-12)
+    assert (mean[229:400] == 50.0).all()
+    assert (std[229:400] == 0.0).all()
+
+
+def test_kernel_array_fallbacks_match_kernels():
+    """
+    Tests that the array fallbacks used without Numba give the same signals
+    as the kernels they replace, across gaps and flat stretches.
+    """
+    close = create_price_data(num_periods=600)["AAA"].to_numpy()
+    close[[40, 41, 300]] = np.nan
+    close[200:260] = 95.0
+
+    z_scores = _kernels._rolling_zscore(close, 20)
+    np.testing.assert_allclose(
+        _kernels._rolling_zscore_vectorized(close, 20), z_scores, rtol=1e-9
+    )
+    np.testing.assert_array_equal(
+        _kernels._mean_rev_signals_vectorized(z_scores, 1.0),
+        _kernels._mean_rev_signals_loop(z_scores, 1.0),
+    )
+    np.testing.assert_array_equal(
+        _kernels._coint_signals_vectorized(close, 20, 1.0),
+        _kernels._coint_signals_loop(close, 20, 1.0),
+    )
+    np.testing.assert_array_equal(
+        _kernels._ma_cross_vectorized(close, 10, 40),
+        _kernels._ma_cross_loop(close, 10, 40),
+    )
+
+    windows = np.array([10, 20, 40])
+    means = np.stack([_kernels._rolling_mean(close, w) for w in windows])
+    np.testing.assert_allclose(
+        np.stack([_kernels._rolling_mean_vectorized(close, w) for w in windows]),
+        means,
+        rtol=1e-12,
+    )
+    short_rows, long_rows = np.array([0, 0, 1]), np.array([1, 2, 2])
+    np.testing.assert_array_equal(
+        _kernels._ma_cross_batch_vectorized(
+            means, short_rows, long_rows, windows[long_rows]
+        ),
+        _kernels._ma_cross_batch(means, short_rows, long_rows, windows[long_rows]),
+    )
@@ -0,0 +1,251 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from alpha_models.base_model import BaseAlphaModel
+from alpha_models.mean_reversion import MeanReversionStrategy
+from alpha_models.moving_average_crossover import MovingAverageCrossoverStrategy
+from alpha_models.push_response_strategy import PushResponseStrategy
+from backtesting.backtester import Backtester
+from backtesting.events import Direction
+from backtesting.parameter_generator import (
+    MACrossoverParameterGenerator,
+    MeanReversionParameterGenerator,
+    PushResponseParameterGenerator,
+)
+from backtesting.parameter_sweep import run_ma_crossover_sweep, run_parameter_sweep
+from backtesting.portfolio_backtester import PortfolioBacktester
+from backtesting.risk_manager import PortfolioRiskManager
+from execution.simulated_handler import SimulatedExecutionHandler
+
+
+def create_price_data(num_periods: int = 300, seed: int = 7) -> pd.DataFrame:
+    """Creates a sample single-asset DataFrame with a random-walk 'Close'."""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2022-01-03", periods=num_periods, freq="B")
+    close = 100 + np.cumsum(rng.normal(size=num_periods))
+    return pd.DataFrame({"Close": close}, index=dates)
+
+
+class FixedSignalModel(BaseAlphaModel):
+    """A model that replays a precomputed signal column."""
+
+    def __init__(self, signal: pd.Series):
+        super().__init__()
+        self.signal = signal
+
+    def generate_signals(self, price_data: pd.DataFrame) -> pd.DataFrame:
+        return pd.DataFrame({"signal": self.signal}, index=price_data.index)
+
+
+def test_backtester_trades_on_signal_bars_only():
+    """
+    Tests that the backtester buys all it can afford on a buy signal while
+    flat, holds through non-zero signals, and liquidates on a zero signal.
+    """
+    dates = pd.date_range("2023-01-02", periods=6, freq="B")
+    price_data = pd.DataFrame(
+        {"Close": [10.0, 10.0, 20.0, 20.0, 25.0, 25.0]}, index=dates
+    )
+    signal = pd.Series([-1, 1, 1, -1, 0, 1], index=dates)
+    handler = SimulatedExecutionHandler(slippage_pct=0.0, commission_per_trade=0.0)
+    backtester = Backtester(initial_capital=1000.0, execution_handler=handler)
+
+    portfolio = backtester.run(price_data, FixedSignalModel(signal))
+
+    # Buy 100 shares at 10 on day 2, sell them at 25 on day 5, then buy again
+    # with the proceeds at 25 on day 6
+    assert portfolio["position"].tolist() == [0, 100, 100, 100, 0, 100]
+    assert portfolio["cash"].tolist() == [1000.0, 0.0, 0.0, 0.0, 2500.0, 0.0]
+    assert [fill.direction for fill in backtester.trade_log] == [
+        Direction.BUY,
+        Direction.SELL,
+        Direction.BUY,
+    ]
+    np.testing.assert_allclose(
+        portfolio["total"],
+        portfolio["cash"] + portfolio["position"] * price_data["Close"],
+    )
+
+
+def test_portfolio_backtester_marks_holdings_at_latest_price():
+    """
+    Tests that the portfolio backtester sizes buys by target weight and
+    values a ticker without a price on some day at its latest earlier close.
+    """
+    dates = pd.date_range("2023-01-02", periods=4, freq="B")
+    price_data = {
+        "AAA": pd.DataFrame({"Close": [10.0, 11.0, 12.0, 13.0]}, index=dates),
+        # No price for BBB on the third day
+        "BBB": pd.DataFrame({"Close": [20.0, 20.0, 25.0]}, index=dates[[0, 1, 3]]),
+    }
+    signals_data = {
+        ticker: pd.DataFrame({"signal": [1, 0, 0, -1]}, index=dates)
+        for ticker in price_data
+    }
+    backtester = PortfolioBacktester(
+        initial_capital=1000.0,
+        execution_handler=SimulatedExecutionHandler(
+            slippage_pct=0.0, commission_per_trade=0.0
+        ),
+        risk_manager=PortfolioRiskManager(max_trade_risk_pct=1.0),
+    )
+
+    portfolio, trade_log = backtester.run(
+        price_data, signals_data, {"AAA": 0.5, "BBB": 0.5}
+    )
+
+    assert portfolio["AAA_pos"].tolist() == [50.0, 50.0, 50.0, 0.0]
+    assert portfolio["BBB_pos"].tolist() == [25.0, 25.0, 25.0, 0.0]
+    assert portfolio["holdings_value"].tolist()[1:3] == [1050.0, 1100.0]
+    assert portfolio["cash"].iloc[-1] == 1275.0
+    assert trade_log["direction"].tolist() == [1, 1, -1, -1]
+
+
+def test_portfolio_backtester_acts_on_off_calendar_signals_at_next_bar():
+    """
+    Tests that the portfolio history follows the price dates only, and that
+    a signal issued on a day without prices is acted on at the next bar.
+    """
+    dates = pd.date_range("2023-01-05", periods=4, freq="B")  # Thu to Tue
+    price_data = {"AAA": pd.DataFrame({"Close": [10.0, 10.0, 12.0, 12.0]}, index=dates)}
+    # A buy on Saturday and a sell on Tuesday
+    signal_dates = pd.DatetimeIndex(["2023-01-07", "2023-01-10"])
+    signals_data = {"AAA": pd.DataFrame({"signal": [1, -1]}, index=signal_dates)}
+    backtester = PortfolioBacktester(
+        initial_capital=1000.0,
+        execution_handler=SimulatedExecutionHandler(
+            slippage_pct=0.0, commission_per_trade=0.0
+        ),
+        risk_manager=PortfolioRiskManager(max_trade_risk_pct=1.0),
+    )
+
+    portfolio, trade_log = backtester.run(price_data, signals_data, {"AAA": 1.0})
+
+    assert portfolio.index.equals(dates)
+    assert portfolio["AAA_pos"].tolist() == [0.0, 0.0, 83.0, 0.0]
+    assert trade_log["timestamp"].tolist() == [dates[2], dates[3]]
+
+
+def test_portfolio_backtester_metrics_use_initial_capital():
+    """
+    Tests that the portfolio backtester's total return is measured against
+    its initial capital.
+    """
+    dates = pd.date_range("2023-01-02", periods=4, freq="B")
+    price_data = {"AAA": pd.DataFrame({"Close": [10.0, 11.0, 12.0, 13.0]}, index=dates)}
+    signals_data = {"AAA": pd.DataFrame({"signal": [1, 0, 0, -1]}, index=dates)}
+    backtester = PortfolioBacktester(
+        initial_capital=1000.0,
+        execution_handler=SimulatedExecutionHandler(
+            slippage_pct=0.0, commission_per_trade=0.0
+        ),
+        risk_manager=PortfolioRiskManager(max_trade_risk_pct=1.0),
+    )
+
+    backtester.run(price_data, signals_data, {"AAA": 1.0})
+    metrics = backtester.get_performance_metrics()
+
+    assert metrics["Final Value"] == 1300.0
+    assert metrics["Total Return"] == pytest.approx(0.3)
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_parameter_sweep_returns_one_row_per_combination(n_jobs):
+    """
+    Tests that the sweep backtests every combination, in order, and tags
+    each metrics dict with its parameters.
+    """
+    generator = MeanReversionParameterGenerator(
+        {"mr_window_range": [10, 20], "mr_threshold_range": [1.0, 1.5]}
+    )
+    combinations = list(generator.generate_combinations())
+
+    results = run_parameter_sweep(
+        create_price_data(), MeanReversionStrategy, combinations, n_jobs=n_jobs
+    )
+
+    assert [(r["window"], r["threshold"]) for r in results] == [
+        (params["window"], params["threshold"]) for params, _ in combinations
+    ]
+    assert all("Sharpe Ratio" in r for r in results)
+
+
+def test_ma_crossover_grid_keeps_only_short_below_long():
+    """
+    Tests that the MA crossover grid drops pairs whose short window is not
+    shorter than the long one, and that the combinations follow the grid.
+    """
+    generator = MACrossoverParameterGenerator(
+        {
+            "mac_short_range": [10, 30],
+            "mac_short_step": 10,
+            "mac_long_range": [20, 40],
+            "mac_long_step": 10,
+        }
+    )
+
+    grid = generator.generate_grid()
+
+    assert grid["short_window"].tolist() == [10, 10, 10, 20, 20, 30]
+    assert grid["long_window"].tolist() == [20, 30, 40, 30, 40, 40]
+    assert [params for params, _ in generator.generate_combinations()] == [
+        {"short_window": s, "long_window": l}
+        for s, l in zip(grid["short_window"], grid["long_window"])
+    ]
+
+
+def test_batched_ma_crossover_sweep_matches_per_model_sweep():
+    """
+    Tests that the batched MA crossover sweep gives the same metrics as
+    backtesting one strategy instance per combination.
+    """
+    generator = MACrossoverParameterGenerator(
+        {
+            "mac_short_range": [5, 15],
+            "mac_short_step": 5,
+            "mac_long_range": [10, 40],
+            "mac_long_step": 10,
+        }
+    )
+    # Without slippage the fills are deterministic
+    handler = SimulatedExecutionHandler(slippage_pct=0.0)
+
+    batched = run_ma_crossover_sweep(
+        create_price_data(), generator.generate_grid(), execution_handler=handler
+    )
+    expected = run_parameter_sweep(
+        create_price_data(),
+        MovingAverageCrossoverStrategy,
+        generator.generate_combinations(),
+        n_jobs=1,
+        execution_handler=handler,
+    )
+
+    assert pd.DataFrame(batched).equals(pd.DataFrame(expected))
+
+
+def test_push_response_sweep_covers_the_grid():
+    """
+    Tests that the push-response generator yields the full grid and that
+    every combination can be backtested in a sweep.
+    """
+    generator = PushResponseParameterGenerator(
+        {
+            "pr_tau_values": [3, 5],
+            "pr_training_window_values": [40, 60],
+            "pr_num_bins_values": [5],
+            "pr_threshold_values": [0.0, 0.1],
+            "pr_refit_every": 5,
+        }
+    )
+    combinations = list(generator.generate_combinations())
+
+    results = run_parameter_sweep(
+        create_price_data(), PushResponseStrategy, combinations, n_jobs=1
+    )
+
+    assert len(combinations) == 8
+    assert [(r["tau"], r["training_window"], r["threshold"]) for r in results] == [
+        (p["tau"], p["training_window"], p["threshold"]) for p, _ in combinations
+    ]
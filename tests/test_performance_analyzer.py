@@ -0,0 +1,22 @@
+import numpy as np
+
+from analysis.performance_analyzer import _drawdown_stats, _drawdown_stats_vectorized
+
+
+def test_drawdown_array_fallback_matches_kernel():
+    """
+    Tests that the drawdown fallback used without Numba gives the same
+    drawdowns, maximum drawdown and longest duration as the compiled pass,
+    including across missing values.
+    """
+    rng = np.random.default_rng(11)
+    values = (100 + np.cumsum(rng.normal(size=1000))).astype(np.float32)
+    values[[0, 1, 400, 401]] = np.nan
+
+    drawdown, max_drawdown, duration = _drawdown_stats_vectorized(values)
+    expected_drawdown, expected_max, expected_duration = _drawdown_stats(values)
+
+    np.testing.assert_array_equal(drawdown, expected_drawdown)
+    assert drawdown.dtype == np.float32
+    assert max_drawdown == expected_max
+    assert duration == expected_duration
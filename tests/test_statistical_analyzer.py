@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+from statsmodels.tsa.stattools import coint
+
+from analysis.statistical_analyzer import StatisticalAnalyzer
+
+
+def create_price_data(num_periods: int = 200, seed: int = 3) -> pd.DataFrame:
+    """Creates a two-asset random-walk price DataFrame."""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2023-01-02", periods=num_periods, freq="B")
+    prices = 100 + np.cumsum(rng.normal(size=(num_periods, 2)), axis=0)
+    return pd.DataFrame(prices, index=dates, columns=["AAA", "BBB"])
+
+
+def test_kalman_smoother_batch_matches_single_series():
+    """
+    Tests that smoothing several columns at once gives the same result as
+    smoothing each one on its own, with each column's missing values dropped.
+    """
+    price_df = create_price_data()
+    price_df.iloc[:15, 1] = np.nan
+    analyzer = StatisticalAnalyzer()
+
+    results = analyzer.run_kalman_filter_smoother_many(price_df)
+
+    for symbol in price_df.columns:
+        expected = analyzer.run_kalman_filter_smoother(price_df[symbol])
+        pd.testing.assert_frame_equal(results[symbol], expected)
+    assert len(results["BBB"]) == len(price_df) - 15
+    assert np.isfinite(results["BBB"]["smoothed"]).all()
+
+
+def test_kalman_smoother_single_precision_tracks_double():
+    """Tests that the float32 filter state stays close to the float64 result."""
+    series = create_price_data()["AAA"]
+    analyzer = StatisticalAnalyzer()
+
+    single = analyzer.run_kalman_filter_smoother(series, dtype=np.float32)
+    double = analyzer.run_kalman_filter_smoother(series, dtype=np.float64)
+
+    assert single["smoothed"].dtype == np.float64
+    np.testing.assert_allclose(single["smoothed"], double["smoothed"], rtol=1e-5)
+
+
+def test_pair_screening_matches_individual_tests():
+    """
+    Tests that screening in parallel returns, for every column pair, the
+    same result as running the Engle-Granger test on that pair directly.
+    """
+    price_df = create_price_data()
+    price_df["CCC"] = 2 * price_df["AAA"] + np.random.default_rng(5).normal(
+        size=len(price_df)
+    )
+    analyzer = StatisticalAnalyzer()
+
+    results = analyzer.run_pair_screening(price_df, n_jobs=2)
+
+    assert list(results) == [("AAA", "BBB"), ("AAA", "CCC"), ("BBB", "CCC")]
+    for (first, second), result in results.items():
+        expected = analyzer.run_engle_granger_test(price_df[first], price_df[second])
+        assert result["p_value"] == expected["p_value"]
+        assert result["hedge_ratio"] == expected["hedge_ratio"]
+    assert results[("AAA", "CCC")]["is_cointegrated"]
+
+
+def test_fast_engle_granger_uses_schwert_lag():
+    """
+    Tests that the fast Engle-Granger test matches statsmodels' coint() run
+    with the fixed Schwert-rule lag instead of AIC lag selection.
+    """
+    price_df = create_price_data()
+    price_df["CCC"] = 2 * price_df["AAA"] + np.random.default_rng(5).normal(
+        size=len(price_df)
+    )
+    maxlag = int(12 * (len(price_df) / 100) ** 0.25)
+
+    result = StatisticalAnalyzer().run_engle_granger_test(
+        price_df["CCC"], price_df["AAA"], fast=True
+    )
+    expected = coint(price_df["CCC"], price_df["AAA"], autolag=None, maxlag=maxlag)
+
+    assert np.isclose(result["test_statistic"], expected[0])
+    assert np.isclose(result["p_value"], expected[1])
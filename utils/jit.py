@@ -0,0 +1,30 @@
+"""
+Optional Numba support for the compiled kernels shared across packages.
+
+Numba is an optional dependency. When it is not installed, `njit` degrades to
+a no-op decorator and `prange` to the built-in `range`, so the kernels still
+run (as plain Python) with identical results, just without native compilation
+or parallel loops.
+"""
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only when numba is absent
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """
+        A stand-in for `numba.njit` that returns the function unchanged.
+
+        Supports both the bare `@njit` and the parameterised `@njit(...)` forms.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator